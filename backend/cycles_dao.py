@@ -172,6 +172,22 @@ def get_cycles(limit: int = 50) -> List[dict]:
     )
 
 
+def get_cycles_since(last_id: int, limit: int = 50) -> List[dict]:
+    """
+    Cycles newer than last_id (newest first) – incremental dashboard refresh.
+    """
+    return query(
+        """
+        SELECT *
+        FROM cycles
+        WHERE id > %s
+        ORDER BY id DESC
+        LIMIT %s
+        """,
+        (last_id, limit),
+    )
+
+
 # ======================================================
 # PENDING QR PRINT QUEUE (FIRST PRINT)
 # ======================================================
@@ -5,7 +5,7 @@
 import logging
 import os
 
-from backend.usb_printer_manager import usb_printer
+from backend.usb_printer_manager import get_usb_printer
 from backend.qr_generator import generate_qr_for_reprint
 
 log = logging.getLogger(__name__)
@@ -56,7 +56,7 @@ def try_print_live_cycle(cycle_row: dict):
         # --------------------------------------------------
         # 🖨 PRINT
         # --------------------------------------------------
-        result = usb_printer.print_cycle(cycle_row)
+        result = get_usb_printer().print_cycle(cycle_row)
 
         log.info(
             "Live print attempted for cycle %s",
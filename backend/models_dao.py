@@ -4,11 +4,15 @@ import json
 import os
 import logging
 from .db import query
+from .model_watchdog import register_listener
 
 log = logging.getLogger(__name__)
 
 ACTIVE_MODEL_FILE = os.path.join(os.path.dirname(__file__), "active_model.json")
 
+# In-process memo of the active model; None = not loaded / invalidated
+_active_model_cache = None
+
 # ---------------------------------------------------------------------------
 #  MODELS CRUD
 # ---------------------------------------------------------------------------
@@ -84,6 +88,8 @@ def update_model(
         (name, model_type, lower_limit, upper_limit, touch_point, model_id)
     )
 
+    invalidate_active_model_cache()
+
     log.info(
         "Updated model %s: %s (%s) limits %.2f-%.2f touch_point=%.2f",
         model_id, name, model_type, lower_limit, upper_limit, touch_point
@@ -99,6 +105,7 @@ def delete_model(model_id: int) -> int:
         "DELETE FROM models WHERE id = %s",
         (model_id,)
     )
+    invalidate_active_model_cache()
     log.info("Deleted model %s", model_id)
     return result
 
@@ -107,6 +114,18 @@ def delete_model(model_id: int) -> int:
 #  ACTIVE MODEL HANDLING (DB + JSON CACHE)
 # ---------------------------------------------------------------------------
 
+def invalidate_active_model_cache(*_):
+    """
+    Drop the in-process active model memo; next get_active_model() reloads.
+    """
+    global _active_model_cache
+    _active_model_cache = None
+
+
+# The watchdog rewrites active_model.json when the model changes in the DB
+register_listener(invalidate_active_model_cache)
+
+
 def set_active_model(model_id: int):
     """
     Updates the active model in DB and writes the same model info
@@ -119,6 +138,8 @@ def set_active_model(model_id: int):
         (model_id,)
     )
 
+    invalidate_active_model_cache()
+
     # Fetch full model details (includes touch_point)
     model = get_model_by_id(model_id)
     if not model:
@@ -135,15 +156,24 @@ def set_active_model(model_id: int):
 
 def get_active_model() -> dict:
     """
+    Fastest: in-process memo
     Fast path: JSON
     Fallback: DB
     """
+    global _active_model_cache
+
+    # 0️⃣ Memo (invalidated on every active-model write)
+    model = _active_model_cache
+    if model is not None:
+        return dict(model)
 
     # 1️⃣ Try JSON cache
     if os.path.exists(ACTIVE_MODEL_FILE):
         try:
             with open(ACTIVE_MODEL_FILE, "r") as f:
-                return json.load(f)
+                model = json.load(f)
+            _active_model_cache = model
+            return dict(model)
         except Exception:
             pass  # fallback to DB
 
@@ -160,10 +190,11 @@ def get_active_model() -> dict:
 
     # Refresh JSON cache
     if model:
+        _active_model_cache = model
         try:
             with open(ACTIVE_MODEL_FILE, "w") as f:
                 json.dump(model, f, indent=4)
         except Exception:
             pass
 
-    return model
+    return dict(model) if model else model
@@ -1,16 +1,43 @@
 import logging
 import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import win32print
-from backend.db import query
-from backend.usb_printer_manager import usb_printer
+from backend.db import pool, query
+from backend.usb_printer_manager import get_usb_printer
 from backend.gsm_modem import gsm
+from config.app_config import PRINTER_CHECK_INTERVAL
 
 log = logging.getLogger(__name__)
 
+HEALTH_TTL = 2.0  # seconds a successful DB check is trusted
+
+_db_ok_at = 0.0
+
+
+def _ping_database():
+    conn = pool.get_connection()
+    try:
+        conn.ping(reconnect=True)   # COM_PING, no result set
+    finally:
+        conn.close()
+
 
 def check_database():
+    global _db_ok_at
+
+    if time.monotonic() - _db_ok_at < HEALTH_TTL:
+        return True
+
     try:
-        query("SELECT 1")
+        try:
+            _ping_database()
+        except AttributeError:
+            # query() swallows DB errors, so check the result
+            if not query("SELECT 1"):
+                raise RuntimeError("SELECT 1 returned no rows")
+        _db_ok_at = time.monotonic()
         log.info("DB check OK")
         return True
     except Exception as e:
@@ -19,7 +46,9 @@ def check_database():
 
 
 def check_printer():
-    if usb_printer.is_connected:
+    printer = get_usb_printer()
+    printer.wait_for_first_check(PRINTER_CHECK_INTERVAL)
+    if printer.is_connected:
         log.info("Printer ONLINE")
         return True
     log.warning("Printer OFFLINE at startup")
@@ -36,13 +65,33 @@ def check_gsm():
         return False
 
 
+STARTUP_CHECKS = {
+    "db": check_database,
+    "printer": check_printer,
+    "gsm": check_gsm,
+}
+
+
 def run_startup_checks():
     log.info("Running startup self-checks")
 
-    results = {
-        "db": check_database(),
-        "printer": check_printer(),
-        "gsm": check_gsm()
-    }
+    # All checks are I/O bound (DB socket, spooler, serial) – run them
+    # concurrently so startup waits for the slowest, not the sum.
+    with ThreadPoolExecutor(
+        max_workers=len(STARTUP_CHECKS),
+        thread_name_prefix="StartupCheck",
+    ) as executor:
+        futures = {
+            key: executor.submit(check)
+            for key, check in STARTUP_CHECKS.items()
+        }
+
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = future.result()
+        except Exception:
+            log.exception("Startup check '%s' crashed", key)
+            results[key] = False
 
     return results
@@ -17,7 +17,7 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
-from backend.db import query   # ✅ now works
+from backend.db import pool   # ✅ now works
 
 log = logging.getLogger(__name__)
 
@@ -28,24 +28,29 @@ TABLES_TO_TRUNCATE = [
     "qr_codes_archive",
     "sms_queue",
     "sms_queue_archive",
+    "cycles",
+    "cycles_archive",
 ]
 
 def truncate_tables():
     log.warning("🚨 STARTING FULL PRODUCTION DATA TRUNCATION 🚨")
 
-    # Child tables first
-    for table in TABLES_TO_TRUNCATE:
-        query(f"TRUNCATE TABLE {table}")
-        log.info("🧹 Truncated table: %s", table)
-
-    # Parent table → DELETE, not TRUNCATE
-    query("DELETE FROM cycles")
-    query("ALTER TABLE cycles AUTO_INCREMENT = 1")
-    log.info("🧹 Deleted all rows from cycles")
-
-    # Archive can still be truncated
-    query("TRUNCATE TABLE cycles_archive")
-    log.info("🧹 Truncated table: cycles_archive")
+    # One pooled connection for the whole reset.
+    # FK checks are off so the parent `cycles` table can be
+    # TRUNCATEd too (also resets AUTO_INCREMENT).
+    conn = pool.get_connection()
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table in TABLES_TO_TRUNCATE:
+                cursor.execute(f"TRUNCATE TABLE {table}")
+                log.info("🧹 Truncated table: %s", table)
+        finally:
+            cursor.execute("SET FOREIGN_KEY_CHECKS = 1")
+            cursor.close()
+    finally:
+        conn.close()
 
     log.warning("✅ ALL PRODUCTION TABLES CLEARED")
 
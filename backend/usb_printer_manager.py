@@ -3,9 +3,13 @@
 # USB Label Printer Manager – DPI-AWARE IMAGE PRINT
 # ======================================================
 
+import os
 import time
+import ctypes
 import logging
-from threading import Thread
+from ctypes import wintypes
+from collections import OrderedDict
+from threading import Thread, Lock, Event
 from pathlib import Path
 from typing import Optional
 
@@ -18,7 +22,7 @@ from PySide6.QtCore import QObject, Signal
 
 from config.app_config import (
     PRINTER_CHECK_INTERVAL,
-    EXCLUDED_PRINTERS,
+    EXCLUDED_PRINTERS_RE,
     DEFAULT_PRINTER_NAME
 )
 
@@ -33,6 +37,46 @@ LABEL_HEIGHT_IN = 1.46
 
 BACKGROUND_COLOR = "white"   # label background
 
+CANVAS_CACHE_SIZE = 32       # scaled label canvases kept (LRU)
+HANDLE_MAX_AGE = 60.0        # seconds before a pooled spooler handle is reopened
+
+# ======================================================
+# GDI DIB HEADER (StretchDIBits)
+# ======================================================
+
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", ctypes.c_uint32),
+        ("biWidth", ctypes.c_int32),
+        ("biHeight", ctypes.c_int32),
+        ("biPlanes", ctypes.c_uint16),
+        ("biBitCount", ctypes.c_uint16),
+        ("biCompression", ctypes.c_uint32),
+        ("biSizeImage", ctypes.c_uint32),
+        ("biXPelsPerMeter", ctypes.c_int32),
+        ("biYPelsPerMeter", ctypes.c_int32),
+        ("biClrUsed", ctypes.c_uint32),
+        ("biClrImportant", ctypes.c_uint32),
+    ]
+
+
+# Typed prototype: HDCs are pointer-sized, untyped ctypes would pass a C int
+_StretchDIBits = ctypes.WinDLL("gdi32").StretchDIBits
+_StretchDIBits.argtypes = [
+    wintypes.HDC,
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,   # dest x, y, w, h
+    ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,   # src x, y, w, h
+    ctypes.c_void_p,
+    ctypes.POINTER(_BITMAPINFOHEADER),
+    wintypes.UINT,
+    wintypes.DWORD,
+]
+_StretchDIBits.restype = ctypes.c_int
+
 # ======================================================
 # SIGNALS
 # ======================================================
@@ -59,20 +103,49 @@ class USBLabelPrinter:
     def __init__(self):
         self.printer_name: Optional[str] = None
         self.is_connected = False
-        self.running = True
+        self._stop_evt = Event()
+        self._first_check_done = Event()
 
+        # (image_path, mtime, dpi_x, dpi_y) -> ready-to-print canvas
+        self._canvas_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        # (width_px, height_px) -> blank background canvas
+        self._blank_canvases: dict = {}
+
+        # printer name -> (spooler handle, opened_at)
+        self._handle_pool: dict = {}
+        self._pool_lock = Lock()
+
+        # Guards is_connected / printer_name across monitor + caller threads
+        self._state_lock = Lock()
+
+        # Printer DC reused between labels
+        self._cached_hdc = None
+        self._cached_dc_name: Optional[str] = None
+        self._dc_lock = Lock()
+
+        # First discovery runs on the monitor thread, not the caller's
         Thread(target=self._monitor_loop, daemon=True).start()
-        self._check_once()
 
     # --------------------------------------------------
     # STATUS
     # --------------------------------------------------
 
     def _emit(self, connected: bool, name: str = ""):
-        if self.is_connected == connected and self.printer_name == name:
-            return
-        self.is_connected = connected
-        self.printer_name = name if connected else None
+        printer_name = name if connected else None
+
+        with self._state_lock:
+            # Only real transitions reach the UI (offline polls used to
+            # re-emit every interval since None != "")
+            if self.is_connected == connected and self.printer_name == printer_name:
+                return
+            self.is_connected = connected
+            self.printer_name = printer_name
+
+        if not connected:
+            with self._dc_lock:
+                self._release_dc()
+
+        # Emit outside the lock; UI slots are queued to the GUI thread
         printer_signals.printer_status.emit(connected, name)
 
     def _check_once(self):
@@ -83,20 +156,27 @@ class USBLabelPrinter:
             self._emit(False, "")
 
     def _monitor_loop(self):
-        while self.running:
-            try:
-                name = self._find_printer()
-                self._emit(bool(name), name or "")
-            except Exception:
-                self._emit(False, "")
-            time.sleep(PRINTER_CHECK_INTERVAL)
+        while not self._stop_evt.is_set():
+            self._check_once()
+            self._first_check_done.set()
+            if self._stop_evt.wait(PRINTER_CHECK_INTERVAL):
+                break
+
+    def wait_for_first_check(self, timeout: float) -> bool:
+        """
+        Block until the monitor thread has finished its first discovery.
+        """
+        return self._first_check_done.wait(timeout)
 
     # --------------------------------------------------
     # PUBLIC PRINT API
     # --------------------------------------------------
 
     def print_cycle(self, cycle_data: dict):
-        if not self.is_connected or not self.printer_name:
+        with self._state_lock:
+            connected, printer_name = self.is_connected, self.printer_name
+
+        if not connected or not printer_name:
             return False, "Printer not connected"
 
         qr_path = cycle_data.get("qr_image_path")
@@ -108,7 +188,7 @@ class USBLabelPrinter:
             return False, f"QR image not found: {qr_path}"
 
         try:
-            self._print_image(qr_path)
+            self._print_image(printer_name, qr_path)
             log.info("🖨 Label printed: %s", qr_path.name)
             return True, None
         except Exception as e:
@@ -119,63 +199,169 @@ class USBLabelPrinter:
     # CORE IMAGE PRINT (DPI SAFE)
     # --------------------------------------------------
 
-    def _print_image(self, image_path: Path):
+    def _print_image(self, printer_name: str, image_path: Path):
+
+        hPrinter = win32print.OpenPrinter(printer_name)
+        try:
+            with self._dc_lock:
+                hdc = self._printer_dc(printer_name)
+                try:
+                    # --------------------------------------------------
+                    # 🔑 REAL PRINTER DPI (DO NOT ASSUME 300)
+                    # --------------------------------------------------
+                    dpi_x = hdc.GetDeviceCaps(win32con.LOGPIXELSX)
+                    dpi_y = hdc.GetDeviceCaps(win32con.LOGPIXELSY)
+
+                    log.info("Printer DPI detected: %dx%d", dpi_x, dpi_y)
+
+                    canvas = self._get_label_canvas(image_path, dpi_x, dpi_y)
+                    label_w_px, label_h_px = canvas.size
+
+                    # --------------------------------------------------
+                    # PRINT
+                    # --------------------------------------------------
+                    hdc.StartDoc(image_path.name)
+                    hdc.StartPage()
+
+                    if not self._stretch_dib(hdc.GetHandleOutput(), canvas):
+                        dib = ImageWin.Dib(canvas)
+                        dib.draw(
+                            hdc.GetHandleOutput(),
+                            (0, 0, label_w_px, label_h_px)
+                        )
+
+                    hdc.EndPage()
+                    hdc.EndDoc()
+
+                except Exception:
+                    # Never reuse a DC left mid-document
+                    self._release_dc()
+                    raise
+
+        finally:
+            win32print.ClosePrinter(hPrinter)
+
+    # --------------------------------------------------
+    # PRINTER DC (CACHED PER PRINTER)
+    # --------------------------------------------------
+
+    def _printer_dc(self, printer_name: str):
+        """
+        CreatePrinterDC is a slow driver round-trip, so the DC is
+        kept between labels and rebuilt only when the printer changes.
+        Caller must hold self._dc_lock.
+        """
+        if self._cached_hdc is not None and self._cached_dc_name == printer_name:
+            return self._cached_hdc
+
+        self._release_dc()
+
+        hdc = win32ui.CreateDC()
+        hdc.CreatePrinterDC(printer_name)
+        hdc.SetMapMode(win32con.MM_TEXT)
+
+        self._cached_hdc = hdc
+        self._cached_dc_name = printer_name
+        return hdc
 
-        img = Image.open(image_path).convert("RGB")
+    def _release_dc(self):
+        """Caller must hold self._dc_lock."""
+        if self._cached_hdc is not None:
+            try:
+                self._cached_hdc.DeleteDC()
+            except Exception:
+                pass
+        self._cached_hdc = None
+        self._cached_dc_name = None
 
-        hPrinter = win32print.OpenPrinter(self.printer_name)
+    @staticmethod
+    def _stretch_dib(hdc_handle: int, canvas: Image.Image) -> bool:
+        """
+        Blit the canvas straight from a BGR byte buffer.
+        Skips the intermediate DIB copy made by ImageWin.Dib.
+        Returns False so the caller can fall back to ImageWin.
+        """
         try:
-            hdc = win32ui.CreateDC()
-            hdc.CreatePrinterDC(self.printer_name)
-            hdc.SetMapMode(win32con.MM_TEXT)
-
-            # --------------------------------------------------
-            # 🔑 REAL PRINTER DPI (DO NOT ASSUME 300)
-            # --------------------------------------------------
-            dpi_x = hdc.GetDeviceCaps(win32con.LOGPIXELSX)
-            dpi_y = hdc.GetDeviceCaps(win32con.LOGPIXELSY)
-
-            log.info("Printer DPI detected: %dx%d", dpi_x, dpi_y)
-
-            # --------------------------------------------------
-            # LABEL SIZE IN PRINTER PIXELS
-            # --------------------------------------------------
-            label_w_px = int(LABEL_WIDTH_IN * dpi_x)
-            label_h_px = int(LABEL_HEIGHT_IN * dpi_y)
-
-            # --------------------------------------------------
-            # SCALE IMAGE (NO STRETCH)
-            # --------------------------------------------------
-            img.thumbnail((label_w_px, label_h_px), Image.LANCZOS)
-
-            canvas = Image.new(
-                "RGB",
-                (label_w_px, label_h_px),
-                BACKGROUND_COLOR
+            width, height = canvas.size
+            stride = (width * 3 + 3) & ~3     # DIB rows are DWORD aligned
+            bits = canvas.tobytes("raw", "BGR", stride)
+
+            bmi = _BITMAPINFOHEADER()
+            bmi.biSize = ctypes.sizeof(_BITMAPINFOHEADER)
+            bmi.biWidth = width
+            bmi.biHeight = -height            # top-down rows
+            bmi.biPlanes = 1
+            bmi.biBitCount = 24
+            bmi.biCompression = BI_RGB
+
+            lines = _StretchDIBits(
+                hdc_handle,
+                0, 0, width, height,
+                0, 0, width, height,
+                bits,
+                ctypes.byref(bmi),
+                DIB_RGB_COLORS,
+                win32con.SRCCOPY,
             )
+            return lines > 0
+        except Exception:
+            log.debug("StretchDIBits failed, falling back to ImageWin", exc_info=True)
+            return False
 
-            x = (label_w_px - img.width) // 2
-            y = (label_h_px - img.height) // 2
-            canvas.paste(img, (x, y))
+    # --------------------------------------------------
+    # LABEL CANVAS (CACHED)
+    # --------------------------------------------------
 
-            # --------------------------------------------------
-            # PRINT
-            # --------------------------------------------------
-            hdc.StartDoc(image_path.name)
-            hdc.StartPage()
+    def _get_label_canvas(self, image_path: Path, dpi_x: int, dpi_y: int) -> Image.Image:
+        """
+        Scaled + centered label image for the given printer DPI.
 
-            dib = ImageWin.Dib(canvas)
-            dib.draw(
-                hdc.GetHandleOutput(),
-                (0, 0, label_w_px, label_h_px)
-            )
+        Cached per (file, mtime, DPI) so reprints of an unchanged
+        QR image skip decode, resampling and paste.
+        """
+        key = (str(image_path), os.path.getmtime(image_path), dpi_x, dpi_y)
 
-            hdc.EndPage()
-            hdc.EndDoc()
-            hdc.DeleteDC()
+        canvas = self._canvas_cache.get(key)
+        if canvas is not None:
+            self._canvas_cache.move_to_end(key)
+            return canvas
 
-        finally:
-            win32print.ClosePrinter(hPrinter)
+        # --------------------------------------------------
+        # LABEL SIZE IN PRINTER PIXELS
+        # --------------------------------------------------
+        label_w_px = int(LABEL_WIDTH_IN * dpi_x)
+        label_h_px = int(LABEL_HEIGHT_IN * dpi_y)
+
+        # --------------------------------------------------
+        # SCALE IMAGE (NO STRETCH)
+        # Labels are bi-level QR + bold text; BILINEAR is visually
+        # identical to LANCZOS here at a fraction of the cost.
+        # No-op when the label already fits (e.g. 300 DPI).
+        # --------------------------------------------------
+        img = Image.open(image_path)
+        img.load()
+        if img.mode != "RGB":       # qr_generator already writes RGB PNGs
+            img = img.convert("RGB")
+        img.thumbnail((label_w_px, label_h_px), Image.Resampling.BILINEAR)
+
+        canvas = self._blank_canvas(label_w_px, label_h_px)
+
+        x = (label_w_px - img.width) // 2
+        y = (label_h_px - img.height) // 2
+        canvas.paste(img, (x, y))
+
+        self._canvas_cache[key] = canvas
+        if len(self._canvas_cache) > CANVAS_CACHE_SIZE:
+            self._canvas_cache.popitem(last=False)
+
+        return canvas
+
+    def _blank_canvas(self, width: int, height: int) -> Image.Image:
+        blank = self._blank_canvases.get((width, height))
+        if blank is None:
+            blank = Image.new("RGB", (width, height), BACKGROUND_COLOR)
+            self._blank_canvases[(width, height)] = blank
+        return blank.copy()
 
     # --------------------------------------------------
     # PRINTER DISCOVERY
@@ -193,8 +379,7 @@ class USBLabelPrinter:
                     return name
 
         for _, _, name, _ in printers:
-            lname = name.lower()
-            if any(x in lname for x in EXCLUDED_PRINTERS):
+            if EXCLUDED_PRINTERS_RE.search(name):
                 continue
             if self._is_ready(name):
                 return name
@@ -202,13 +387,59 @@ class USBLabelPrinter:
         return None
 
     def _is_ready(self, name: str) -> bool:
+        # Level 2 is the smallest GetPrinter level pywin32 exposes
+        # that carries Status (level 1 has no status field).
+        with self._pool_lock:
+            try:
+                h = self._pooled_handle(name)
+                info = win32print.GetPrinter(h, 2)
+            except Exception:
+                self._drop_handle(name)
+                return False
+        return info.get("Status", 1) == 0
+
+    # --------------------------------------------------
+    # SPOOLER HANDLE POOL
+    # --------------------------------------------------
+
+    def _pooled_handle(self, name: str):
+        """
+        Reuse an open spooler handle for `name`.
+        Caller must hold self._pool_lock.
+        """
+        now = time.monotonic()
+        entry = self._handle_pool.get(name)
+
+        if entry is not None:
+            handle, opened_at = entry
+            if now - opened_at < HANDLE_MAX_AGE:
+                return handle
+            self._drop_handle(name)
+
+        handle = win32print.OpenPrinter(name)
+        self._handle_pool[name] = (handle, now)
+        return handle
+
+    def _drop_handle(self, name: str):
+        entry = self._handle_pool.pop(name, None)
+        if entry is None:
+            return
         try:
-            h = win32print.OpenPrinter(name)
-            info = win32print.GetPrinter(h, 2)
-            win32print.ClosePrinter(h)
-            return info.get("Status", 1) == 0
+            win32print.ClosePrinter(entry[0])
         except Exception:
-            return False
+            pass
+
+    def close_all(self):
+        """Close every pooled spooler handle."""
+        with self._pool_lock:
+            for name in list(self._handle_pool):
+                self._drop_handle(name)
+
+    def stop(self):
+        self._stop_evt.set()
+        self.close_all()
+        with self._dc_lock:
+            self._release_dc()
 
         # --------------------------------------------------
     # BACKWARD-COMPAT UI STATUS EMIT
@@ -218,13 +449,38 @@ class USBLabelPrinter:
         Called by FooterWidget on startup.
         Emits last known printer state.
         """
-        printer_signals.printer_status.emit(
-            self.is_connected,
-            self.printer_name or ""
-        )
+        with self._state_lock:
+            connected, name = self.is_connected, self.printer_name
+
+        printer_signals.printer_status.emit(connected, name or "")
 
 # ======================================================
-# SINGLETON INSTANCE
+# SINGLETON INSTANCE (LAZY)
 # ======================================================
 
-usb_printer = USBLabelPrinter()
+_usb_printer: Optional[USBLabelPrinter] = None
+_usb_printer_lock = Lock()
+
+
+def get_usb_printer() -> USBLabelPrinter:
+    """
+    Return the shared printer manager.
+
+    Created on first use so importing this module does not
+    enumerate printers or start the monitor thread.
+    """
+    global _usb_printer
+
+    if _usb_printer is None:
+        with _usb_printer_lock:
+            if _usb_printer is None:
+                _usb_printer = USBLabelPrinter()
+
+    return _usb_printer
+
+
+def __getattr__(name: str):
+    # Backward compatibility: `from backend.usb_printer_manager import usb_printer`
+    if name == "usb_printer":
+        return get_usb_printer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
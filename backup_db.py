@@ -14,12 +14,6 @@ from pathlib import Path
 
 from config.app_config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
 
-# Database configuration (from config)
-# DB_HOST = "localhost"
-# DB_USER = "svr_user"
-# DB_PASSWORD = "india123"
-# DB_NAME = "pneumatic_qc"
-
 # Project root directory
 PROJECT_ROOT = Path(__file__).resolve().parent
 
@@ -41,12 +35,13 @@ def create_backup():
     try:
         print(f"Starting database backup to {backup_file}...")
 
-        with open(backup_file, "w") as f:
-            result = subprocess.run(
+        # Binary mode: mysqldump bytes go straight to the file
+        # without a decode/re-encode pass
+        with open(backup_file, "wb") as f:
+            subprocess.run(
                 command,
                 stdout=f,
                 stderr=subprocess.PIPE,
-                text=True,
                 check=True
             )
 
@@ -54,7 +49,7 @@ def create_backup():
         return str(backup_file)
 
     except subprocess.CalledProcessError as e:
-        print(f"Backup failed: {e.stderr}")
+        print(f"Backup failed: {e.stderr.decode('utf-8', errors='replace')}")
         sys.exit(1)
     except FileNotFoundError:
         print("Error: mysqldump not found. Ensure MySQL is installed and in PATH.")
@@ -5,11 +5,14 @@
 # Creates a FULL backup (schema + data) of the MySQL database
 # using mysqldump.
 #
-# Output: backup_full_YYYYMMDD_HHMMSS.sql in the project root.
+# Output: backup_full_YYYYMMDD_HHMMSS.sql.gz in the project root.
 # ======================================================
 
+import gzip
+import shutil
 import subprocess
 import sys
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -18,11 +21,14 @@ from config.app_config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
 # Project root directory
 PROJECT_ROOT = Path(__file__).resolve().parent
 
+COPY_CHUNK = 1024 * 1024    # bytes per read from mysqldump
+GZIP_LEVEL = 1              # fastest; dump text still shrinks ~5-10x
+
 
 def create_full_backup():
     # Generate timestamped filename
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_file = PROJECT_ROOT / f"backup_full_{timestamp}.sql"
+    backup_file = PROJECT_ROOT / f"backup_full_{timestamp}.sql.gz"
 
     # mysqldump command (schema + data)
     command = [
@@ -42,14 +48,26 @@ def create_full_backup():
     try:
         print(f"Starting FULL database backup to {backup_file}...")
 
-        with open(backup_file, "w", encoding="utf-8") as f:
-            subprocess.run(
+        # Stream dump → gzip without holding it in memory.
+        # stderr goes to a temp file so a chatty mysqldump
+        # cannot block on a full pipe while we read stdout.
+        with tempfile.TemporaryFile() as err, \
+                gzip.open(backup_file, "wb", compresslevel=GZIP_LEVEL) as gz:
+            proc = subprocess.Popen(
                 command,
-                stdout=f,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
+                stdout=subprocess.PIPE,
+                stderr=err,
             )
+            shutil.copyfileobj(proc.stdout, gz, length=COPY_CHUNK)
+            proc.stdout.close()
+
+            if proc.wait() != 0:
+                err.seek(0)
+                raise subprocess.CalledProcessError(
+                    proc.returncode,
+                    command,
+                    stderr=err.read().decode("utf-8", errors="replace"),
+                )
 
         print(f"Full backup completed successfully: {backup_file}")
         return str(backup_file)
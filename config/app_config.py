@@ -9,9 +9,29 @@ Application Configuration
 Designed for offline / kiosk / industrial systems
 """
 
+import functools
 import json
 import os
+import re
 import logging
+import threading
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    _json_dumps = orjson.dumps
+except ImportError:
+    try:
+        import ujson as _fastjson
+    except ImportError:
+        _fastjson = json
+
+    _json_loads = _fastjson.loads
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
 
 log = logging.getLogger(__name__)
 
@@ -28,18 +48,51 @@ SECURITY_FILE = os.path.join(CONFIG_DIR, "security.json")  # Keep separate for s
 # Load Config
 # ==================================================
 
+@functools.lru_cache(maxsize=1)
+def _parse_config(path: str) -> dict:
+    # Read once per process; settings derived from it are never re-read,
+    # so config.json edits take effect on restart
+    with open(path, "rb") as f:
+        return _json_loads(f.read())
+
+
 def _load_config():
-    if not os.path.exists(CONFIG_FILE):
-        log.error(f"Config file not found: {CONFIG_FILE}")
-        return {}
     try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
+        return _parse_config(CONFIG_FILE)
+    except FileNotFoundError:
+        log.error("Config file not found: %s", CONFIG_FILE)
+        return {}
     except Exception as e:
-        log.error(f"Failed to load config.json: {e}")
+        log.error("Failed to load config.json: %s", e)
         return {}
 
-config = _load_config()
+
+def _flatten(data: dict, prefix: str = "") -> dict:
+    """
+    {"database": {"host": x}} -> {"database.host": x}
+    """
+    flat = {}
+    for key, value in data.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+_CFG = None  # flattened config.json, built on first lookup
+
+
+def _cfg_get(path: str, default=None):
+    """
+    Single dict lookup by dotted path, e.g. "database.host".
+    """
+    global _CFG
+    if _CFG is None:
+        _CFG = _flatten(_load_config())
+    return _CFG.get(path, default)
+
 
 # ==================================================
 # Application Information
@@ -58,28 +111,37 @@ WINDOW_TITLE = f"{APP_NAME} v{VERSION}"
 
 DEFAULT_SETTINGS_PASSWORD = "admin123"
 
-_SETTINGS_PASSWORD = None  # loaded at runtime
+_SETTINGS_PASSWORD = None  # loaded on first use
+_SEC_MTIME = None          # security.json mtime at last load/save
+_sec_lock = threading.Lock()
+
+
+def _security_mtime():
+    try:
+        return os.stat(SECURITY_FILE).st_mtime
+    except OSError:
+        return None
 
 
 def _load_security_config() -> None:
     """
     Load password from security.json.
     Creates file with default password if missing.
+    Caller must hold _sec_lock.
     """
-    global _SETTINGS_PASSWORD
+    global _SETTINGS_PASSWORD, _SEC_MTIME
 
-    if not os.path.exists(SECURITY_FILE):
+    try:
+        with open(SECURITY_FILE, "rb") as f:
+            _SEC_MTIME = os.fstat(f.fileno()).st_mtime
+            data = _json_loads(f.read())
+        _SETTINGS_PASSWORD = data.get(
+            "settings_password",
+            DEFAULT_SETTINGS_PASSWORD
+        )
+    except FileNotFoundError:
         _SETTINGS_PASSWORD = DEFAULT_SETTINGS_PASSWORD
         _save_security_config()
-        return
-
-    try:
-        with open(SECURITY_FILE, "r") as f:
-            data = json.load(f)
-            _SETTINGS_PASSWORD = data.get(
-                "settings_password",
-                DEFAULT_SETTINGS_PASSWORD
-            )
     except Exception:
         log.exception("Failed to load security.json, using default password")
         _SETTINGS_PASSWORD = DEFAULT_SETTINGS_PASSWORD
@@ -88,26 +150,40 @@ def _load_security_config() -> None:
 def _save_security_config() -> None:
     """
     Persist password to security.json.
+    Caller must hold _sec_lock.
     """
+    global _SEC_MTIME
+
     try:
-        with open(SECURITY_FILE, "w") as f:
-            json.dump(
-                {"settings_password": _SETTINGS_PASSWORD},
-                f,
-                indent=4
-            )
+        # Write-then-rename: a crash mid-write never leaves a torn file
+        tmp = SECURITY_FILE + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, _json_dumps({"settings_password": _SETTINGS_PASSWORD}))
+        finally:
+            os.close(fd)
+        os.replace(tmp, SECURITY_FILE)
+        _SEC_MTIME = _security_mtime()
     except Exception:
         log.exception("Failed to save security.json")
 
 
-def verify_settings_password(password: str) -> bool:
+def _ensure_security_loaded() -> None:
     """
-    Verify settings password (plain text).
+    (Re)load only when never loaded or security.json changed on disk.
+    Caller must hold _sec_lock.
     """
-    if _SETTINGS_PASSWORD is None:
+    if _SETTINGS_PASSWORD is None or _security_mtime() != _SEC_MTIME:
         _load_security_config()
 
-    return password == _SETTINGS_PASSWORD
+
+def verify_settings_password(password: str) -> bool:
+    """
+    Verify settings password (plain text).
+    """
+    with _sec_lock:
+        _ensure_security_loaded()
+        return password == _SETTINGS_PASSWORD
 
 
 def update_settings_password(new_password: str) -> None:
@@ -116,102 +192,23 @@ def update_settings_password(new_password: str) -> None:
     """
     global _SETTINGS_PASSWORD
 
-    _SETTINGS_PASSWORD = new_password
-    _save_security_config()
-
-
-# Load password on module import
-_load_security_config()
-
-
-# ==================================================
-# Database Configuration
-# ==================================================
-
-DB_HOST = config.get("database", {}).get("host", "localhost")
-DB_USER = config.get("database", {}).get("user", "svr_user")
-DB_PASSWORD = config.get("database", {}).get("password", "india123")
-DB_NAME = config.get("database", {}).get("name", "pneumatic_qc")
-
-
-# ==================================================
-# Serial Ports
-# ==================================================
-
-SIMULATOR_WRITE_PORT = config.get("serial_ports", {}).get("simulator_write_port", "COM5")
-APP_READ_PORT = config.get("serial_ports", {}).get("app_read_port", "COM6")
-GSM_SIMULATOR_PORT = config.get("serial_ports", {}).get("gsm_simulator_port", "COM2")
-GSM_APP_PORT = config.get("serial_ports", {}).get("gsm_app_port", "COM1")
-LASER_BAUD = config.get("serial_ports", {}).get("laser_baud", 9600)
-PLC_BAUD = config.get("serial_ports", {}).get("plc_baud", 9600)
-GSM_BAUD = config.get("serial_ports", {}).get("gsm_baud", 115200)
-
-
-# ==================================================
-# Peripherals
-# ==================================================
+    with _sec_lock:
+        _ensure_security_loaded()
+        if new_password == _SETTINGS_PASSWORD:
+            return
 
-DEFAULT_GSM_PORT = config.get("peripherals", {}).get("gsm_port", "COM1")
-DEFAULT_PLC_PORT = config.get("peripherals", {}).get("plc_port", "COM6")
-DEFAULT_PRINTER_NAME = config.get("peripherals", {}).get("printer_name", "PDFCreator")
+        _SETTINGS_PASSWORD = new_password
+        _save_security_config()
 
 
 # ==================================================
-# Logging Configuration
+# Logging Format
 # ==================================================
 
-LOG_LEVEL = config.get("app_settings", {}).get("log_level", "INFO")
-
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s: %(message)s"
 LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 
-# ==================================================
-# UI Configuration
-# ==================================================
-
-WINDOW_WIDTH = config.get("app_settings", {}).get("window_width", 1920)
-WINDOW_HEIGHT = config.get("app_settings", {}).get("window_height", 1000)
-
-PRIMARY_COLOR = config.get("app_settings", {}).get("primary_color", "#1d4ed8")
-SUCCESS_COLOR = config.get("app_settings", {}).get("success_color", "#10b981")
-ERROR_COLOR = config.get("app_settings", {}).get("error_color", "#ef4444")
-WARNING_COLOR = config.get("app_settings", {}).get("warning_color", "#f59e0b")
-
-
-# ==================================================
-# Serial Communication Defaults
-# ==================================================
-
-DEFAULT_BAUD_LASER = LASER_BAUD
-DEFAULT_BAUD_PLC = PLC_BAUD
-DEFAULT_BAUD_GSM = GSM_BAUD
-
-SERIAL_TIMEOUT = config.get("app_settings", {}).get("serial_timeout", 1.0)
-SERIAL_WRITE_TIMEOUT = config.get("app_settings", {}).get("serial_write_timeout", 1.0)
-
-
-# ==================================================
-# Timeouts & Intervals
-# ==================================================
-
-GSM_HEARTBEAT_INTERVAL = config.get("app_settings", {}).get("gsm_heartbeat_interval", 5.0)
-GSM_RECONNECT_DELAY = config.get("app_settings", {}).get("gsm_reconnect_delay", 3.0)
-PRINTER_CHECK_INTERVAL = config.get("app_settings", {}).get("printer_check_interval", 5.0)
-
-PLC_POLL_INTERVAL = config.get("app_settings", {}).get("plc_poll_interval", 1000)
-SMS_POLL_INTERVAL = config.get("app_settings", {}).get("sms_poll_interval", 20)
-PURGE_INTERVAL = config.get("app_settings", {}).get("purge_interval", 3600)
-
-
-# ==================================================
-# Limits & Capacities
-# ==================================================
-
-MAX_SMS_QUEUE_SIZE = config.get("app_settings", {}).get("max_sms_queue_size", 200)
-MAX_CYCLE_HISTORY = config.get("app_settings", {}).get("max_cycle_history", 100)
-
-
 # ==================================================
 # File & Directory Paths
 # ==================================================
@@ -223,46 +220,124 @@ PRINTS_DIR = "prints"
 QR_IMAGES_DIR = "qr_images"
 
 
-# ==================================================
-# Default System Settings
-# ==================================================
-
-DEFAULT_QR_PREFIX = config.get("app_settings", {}).get("default_qr_prefix", "G510")
-DEFAULT_QR_START_COUNTER = config.get("app_settings", {}).get("default_qr_start_counter", 100000)
-DEFAULT_MODEL_TYPE = config.get("app_settings", {}).get("default_model_type", "LHD")
-
-
-# ==================================================
-# Data Retention
-# ==================================================
-
-DEFAULT_SMS_RETENTION_HOURS = config.get("app_settings", {}).get("default_sms_retention_hours", 6)
-DEFAULT_QR_RETENTION_HOURS = config.get("app_settings", {}).get("default_qr_retention_hours", 6)
-
-
-# ==================================================
-# Feature Flags
-# ==================================================
-
-ENABLE_SMS = config.get("app_settings", {}).get("enable_sms", True)
-ENABLE_PRINTER = config.get("app_settings", {}).get("enable_printer", True)
-ENABLE_GSM = config.get("app_settings", {}).get("enable_gsm", True)
-
-
 # ==================================================
 # Printer Settings
 # ==================================================
 
-EXCLUDED_PRINTERS = [
+# Lowercase substrings of virtual / non-label printer names
+EXCLUDED_PRINTERS = frozenset((
     "fax",
     "pdf",
     "xps",
     "microsoft",
     "onenote",
-]
-
-# ======================================================
-# TEST / SIMULATION MODE
-# ======================================================
-ENABLE_SIMULATOR = config.get("app_settings", {}).get("enable_simulator", True)
-SIMULATOR_PORT = config.get("app_settings", {}).get("simulator_port", "COM5")
+))
+
+# One case-insensitive pass over a printer name: EXCLUDED_PRINTERS_RE.search(name)
+EXCLUDED_PRINTERS_RE = re.compile(
+    "|".join(re.escape(x) for x in sorted(EXCLUDED_PRINTERS)),
+    re.IGNORECASE
+)
+
+
+# ==================================================
+# config.json-backed settings (resolved lazily)
+# ==================================================
+# NAME -> (dotted config.json path, default). Resolved on first attribute
+# access through __getattr__ below and then cached as a module global, so
+# importing APP_NAME alone never touches config.json.
+
+_DEFAULTS = {
+    # Database Configuration
+    "DB_HOST": ("database.host", "localhost"),
+    "DB_USER": ("database.user", "svr_user"),
+    "DB_PASSWORD": ("database.password", "india123"),
+    "DB_NAME": ("database.name", "pneumatic_qc"),
+
+    # Serial Ports
+    "SIMULATOR_WRITE_PORT": ("serial_ports.simulator_write_port", "COM5"),
+    "APP_READ_PORT": ("serial_ports.app_read_port", "COM6"),
+    "GSM_SIMULATOR_PORT": ("serial_ports.gsm_simulator_port", "COM2"),
+    "GSM_APP_PORT": ("serial_ports.gsm_app_port", "COM1"),
+    "LASER_BAUD": ("serial_ports.laser_baud", 9600),
+    "PLC_BAUD": ("serial_ports.plc_baud", 9600),
+    "GSM_BAUD": ("serial_ports.gsm_baud", 115200),
+
+    # Peripherals
+    "DEFAULT_GSM_PORT": ("peripherals.gsm_port", "COM1"),
+    "DEFAULT_PLC_PORT": ("peripherals.plc_port", "COM6"),
+    "DEFAULT_PRINTER_NAME": ("peripherals.printer_name", "PDFCreator"),
+
+    # Logging Configuration
+    "LOG_LEVEL": ("app_settings.log_level", "INFO"),
+
+    # UI Configuration
+    "WINDOW_WIDTH": ("app_settings.window_width", 1920),
+    "WINDOW_HEIGHT": ("app_settings.window_height", 1000),
+    "PRIMARY_COLOR": ("app_settings.primary_color", "#1d4ed8"),
+    "SUCCESS_COLOR": ("app_settings.success_color", "#10b981"),
+    "ERROR_COLOR": ("app_settings.error_color", "#ef4444"),
+    "WARNING_COLOR": ("app_settings.warning_color", "#f59e0b"),
+
+    # Serial Communication Defaults
+    "DEFAULT_BAUD_LASER": ("serial_ports.laser_baud", 9600),
+    "DEFAULT_BAUD_PLC": ("serial_ports.plc_baud", 9600),
+    "DEFAULT_BAUD_GSM": ("serial_ports.gsm_baud", 115200),
+    "SERIAL_TIMEOUT": ("app_settings.serial_timeout", 1.0),
+    "SERIAL_WRITE_TIMEOUT": ("app_settings.serial_write_timeout", 1.0),
+
+    # Timeouts & Intervals
+    "GSM_HEARTBEAT_INTERVAL": ("app_settings.gsm_heartbeat_interval", 5.0),
+    "GSM_RECONNECT_DELAY": ("app_settings.gsm_reconnect_delay", 3.0),
+    "PRINTER_CHECK_INTERVAL": ("app_settings.printer_check_interval", 5.0),
+    "PLC_POLL_INTERVAL": ("app_settings.plc_poll_interval", 1000),
+    "SMS_POLL_INTERVAL": ("app_settings.sms_poll_interval", 20),
+    "PURGE_INTERVAL": ("app_settings.purge_interval", 3600),
+
+    # Limits & Capacities
+    "MAX_SMS_QUEUE_SIZE": ("app_settings.max_sms_queue_size", 200),
+    "MAX_CYCLE_HISTORY": ("app_settings.max_cycle_history", 100),
+
+    # Default System Settings
+    "DEFAULT_QR_PREFIX": ("app_settings.default_qr_prefix", "G510"),
+    "DEFAULT_QR_START_COUNTER": ("app_settings.default_qr_start_counter", 100000),
+    "DEFAULT_MODEL_TYPE": ("app_settings.default_model_type", "LHD"),
+
+    # Data Retention
+    "DEFAULT_SMS_RETENTION_HOURS": ("app_settings.default_sms_retention_hours", 6),
+    "DEFAULT_QR_RETENTION_HOURS": ("app_settings.default_qr_retention_hours", 6),
+
+    # Feature Flags
+    "ENABLE_SMS": ("app_settings.enable_sms", True),
+    "ENABLE_PRINTER": ("app_settings.enable_printer", True),
+    "ENABLE_GSM": ("app_settings.enable_gsm", True),
+    "ENABLE_PLOT_OPENGL": ("app_settings.enable_plot_opengl", False),
+
+    # Test / Simulation Mode
+    "ENABLE_SIMULATOR": ("app_settings.enable_simulator", True),
+    "SIMULATOR_PORT": ("app_settings.simulator_port", "COM5"),
+}
+
+
+def __getattr__(name):
+    if name in _DEFAULTS:
+        path, default = _DEFAULTS[name]
+        value = globals()[name] = _cfg_get(path, default)
+        return value
+    if name == "config":
+        value = globals()[name] = _load_config()
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# `from config.app_config import *` exports the settings only (including the
+# lazy names), never helpers such as `log`
+__all__ = [
+    "CONFIG_DIR", "CONFIG_FILE", "SECURITY_FILE",
+    "APP_NAME", "VERSION", "AUTHOR", "WINDOW_TITLE",
+    "DEFAULT_SETTINGS_PASSWORD",
+    "verify_settings_password", "update_settings_password",
+    "LOG_FORMAT", "LOG_DATE_FORMAT",
+    "FONTS_DIR", "ASSETS_DIR", "LOGS_DIR", "PRINTS_DIR", "QR_IMAGES_DIR",
+    "EXCLUDED_PRINTERS", "EXCLUDED_PRINTERS_RE",
+] + list(_DEFAULTS)
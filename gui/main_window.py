@@ -1,23 +1,24 @@
+import time
+import logging
+from collections import deque
+
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QDialog,
     QLabel, QPushButton, QApplication
 )
-from PySide6.QtCore import QEvent
 
-from PySide6.QtCore import Qt, QTimer, QDateTime, Slot
-from PySide6.QtGui import QFont
+from PySide6.QtCore import (
+    Qt, QTimer, Slot, Signal, QObject, QRunnable, QThreadPool, QEvent
+)
+from PySide6.QtGui import QFont, QCursor
 
-from backend.models_dao import get_active_model
-from backend.cycles_dao import get_cycles
+from backend.models_dao import get_active_model, invalidate_active_model_cache
+from backend.cycles_dao import get_cycles, get_cycles_since
 from backend.sms_sender import sms_signals
-from backend.gsm_modem import modem_signals
-from backend.usb_printer_manager import printer_signals
 
 from config.app_config import WINDOW_TITLE
 
-from gui.windows.settings_window import SettingsWindow
 from gui.windows.password_modal import PasswordModal
-from gui.windows.qr_print_dialog import QRPrintDialog
 from gui.widgets.plot_panel import PlotPanel
 from gui.widgets.result_panel import ResultPanel
 from gui.widgets.cycles_panel import CyclesPanel
@@ -25,6 +26,8 @@ from gui.widgets.footer_widget import FooterWidget
 from gui.widgets.header_widget import HeaderWidget
 from gui.styles.app_styles import apply_base_dialog_style
 
+log = logging.getLogger(__name__)
+
 
 # ============================================================
 # SHUTDOWN CONFIRMATION DIALOG
@@ -81,23 +84,85 @@ class ShutdownConfirmDialog(QDialog):
         root.addLayout(buttons)
 
 
+# ============================================================
+# CYCLES FETCH (WORKER THREAD)
+# ============================================================
+class _CyclesFetchSignals(QObject):
+    cycles_ready = Signal(list)
+
+
+class _CyclesFetchWorker(QRunnable):
+    """
+    Runs get_cycles() on the global thread pool; result is emitted
+    back to the GUI thread (QRunnable itself cannot carry signals).
+    """
+
+    def __init__(self, signals: _CyclesFetchSignals, limit: int, since_id: int):
+        super().__init__()
+        self.signals = signals
+        self.limit = limit
+        self.since_id = since_id
+
+    def run(self):
+        try:
+            if self.since_id:
+                cycles = get_cycles_since(self.since_id, limit=self.limit)
+            else:
+                cycles = get_cycles(limit=self.limit)
+        except Exception:
+            log.exception("Failed to fetch recent cycles")
+            cycles = []
+        self.signals.cycles_ready.emit(cycles or [])
+
+
 # ============================================================
 # MAIN WINDOW
 # ============================================================
 class MainWindow(QWidget):
     KIOSK_MODE = False  # Set to True to enable kiosk mode
 
+    SAMPLE_FLUSH_MS = 33      # laser samples are drained into the plot at ~30 Hz
+    SAMPLE_BUFFER_SIZE = 4096
+    CYCLES_LIMIT = 40
+    CYCLES_DEBOUNCE_MS = 80
+    MODEL_DEBOUNCE_MS = 80
+
+    CURSOR_POLL_MS = 500   # kiosk pointer polling period
+    CURSOR_IDLE_S = 3.0    # hide the cursor after this long without movement
+
+    # Formatted wall-clock text, emitted once per second for any widget
+    clock_tick = Signal(str)
+
+    CLOCK_DATE_FORMAT = "%A, %d %b %Y"
+    CLOCK_TIME_FORMAT = "%H:%M:%S"
+
     def __init__(self, signals):
         super().__init__()
         self.signals = signals
 
+        # Laser samples land here (any thread) and are drained by a timer
+        self._sample_buf = deque(maxlen=self.SAMPLE_BUFFER_SIZE)
+
+        # Recent-cycles fetch runs off the GUI thread, one at a time
+        self._cycles_fetch = _CyclesFetchSignals(self)
+        self._cycles_inflight = False
+        self._cycles_stale = False
+        self._recent_cycles = []   # newest first, at most CYCLES_LIMIT
+        self._last_cycle_id = 0    # 0 = next fetch is a full one
+
+        self._last_laser_status = None
+
+        # Built on first use, then re-shown (see _ask_password)
+        self._password_modal = None
+        self._shutdown_dialog = None
+        self._settings_dialog = None
+
         self.setWindowTitle(WINDOW_TITLE)
         self.setMinimumSize(1600, 900)
 
         self._build_ui()
         self._connect_signals()
         self._init_timers()
-        self._init_cursor_hiding()
 
         if self.KIOSK_MODE:
             self.setWindowFlags(
@@ -108,8 +173,14 @@ class MainWindow(QWidget):
         else:
             self.showMaximized()
 
-        QTimer.singleShot(300, self.refresh_active_model)
-        QTimer.singleShot(500, self.refresh_cycles)
+        self._init_cursor_hiding()
+
+        QTimer.singleShot(300, self._boot_sequence)
+
+    def _boot_sequence(self):
+        # One deferred call once the window is up; cycles load off-thread
+        self.refresh_active_model()
+        self.refresh_cycles()
 
     # ============================================================
     # UI
@@ -150,30 +221,94 @@ class MainWindow(QWidget):
     # SIGNALS
     # ============================================================
     def _connect_signals(self):
-        self.signals.laser_value.connect(self.plot_panel.append_value)
+        # deque.append is thread-safe; no per-sample Python slot or repaint
+        self.signals.laser_value.connect(self._sample_buf.append)
         self.signals.cycle_detected.connect(self.on_cycle_detected)
-        self.signals.laser_status.connect(self.on_laser_status)
+        # main.py / sim_main.py hop both onto the GUI thread with queued
+        # connections before re-emitting them here
+        self.signals.laser_status.connect(
+            self.on_laser_status, Qt.DirectConnection
+        )
+        self.signals.plc_status.connect(
+            self.footer.update_plc_status, Qt.DirectConnection
+        )
+        # FooterWidget subscribes to modem/printer status itself
+        sms_signals.sms_sent.connect(
+            self.footer.show_sms, Qt.UniqueConnection
+        )
 
-        self.signals.plc_status.connect(self.footer.update_plc_status)
-        modem_signals.modem_connected.connect(self.footer.update_modem_status)
-        printer_signals.printer_status.connect(self.footer.update_printer_status)
-        sms_signals.sms_sent.connect(self.footer.show_sms)
+        self.clock_tick.connect(self.header.set_datetime)
+
+        self._cycles_fetch.cycles_ready.connect(
+            self._on_cycles_ready, Qt.QueuedConnection
+        )
 
     # ============================================================
     # TIMERS
     # ============================================================
     def _init_timers(self):
+        # Date part only changes at midnight; cached per (year, day-of-year)
+        self._clock_day = None
+        self._clock_date = ""
+
+        # Re-armed each tick to land just after the next wall-clock second
         self.clock_timer = QTimer(self)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.PreciseTimer)
         self.clock_timer.timeout.connect(self._update_datetime)
-        self.clock_timer.start(1000)
         self._update_datetime()
 
+        self.sample_timer = QTimer(self)
+        self.sample_timer.setTimerType(Qt.PreciseTimer)
+        self.sample_timer.timeout.connect(self._flush_samples)
+        self.sample_timer.start(self.SAMPLE_FLUSH_MS)
+
+        # Bursts of completed cycles collapse into one refresh
+        self.cycles_debounce = QTimer(self)
+        self.cycles_debounce.setSingleShot(True)
+        self.cycles_debounce.setInterval(self.CYCLES_DEBOUNCE_MS)
+        self.cycles_debounce.timeout.connect(self.refresh_cycles)
+
+        # Same for repeated settings_applied emissions and model reloads
+        self.model_debounce = QTimer(self)
+        self.model_debounce.setSingleShot(True)
+        self.model_debounce.setInterval(self.MODEL_DEBOUNCE_MS)
+        self.model_debounce.timeout.connect(self.refresh_active_model)
+
     def _update_datetime(self):
-        self.header.set_datetime(
-            QDateTime.currentDateTime().toString(
-                "dddd, dd MMM yyyy | HH:mm:ss"
-            )
+        # Nobody sees the clock while minimized/hidden: stop re-arming,
+        # showEvent/changeEvent restart it
+        if not self.isVisible() or self.isMinimized():
+            return
+
+        now = time.time()
+        lt = time.localtime(now)
+
+        day = (lt.tm_year, lt.tm_yday)
+        if day != self._clock_day:
+            self._clock_day = day
+            self._clock_date = time.strftime(self.CLOCK_DATE_FORMAT, lt)
+
+        self.clock_tick.emit(
+            f"{self._clock_date} | {time.strftime(self.CLOCK_TIME_FORMAT, lt)}"
         )
+        self.clock_timer.start(1000 - int(now * 1000) % 1000)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._update_datetime()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            self._update_datetime()
+
+    def _flush_samples(self):
+        buf = self._sample_buf
+        if not buf:
+            return
+        batch = [buf.popleft() for _ in range(len(buf))]
+        self.plot_panel.append_values(batch)
 
     # ============================================================
     # CURSOR AUTO-HIDE (KIOSK SAFE)
@@ -183,14 +318,29 @@ class MainWindow(QWidget):
             return
 
         self.cursor_hidden = False
-
-        self.cursor_timer = QTimer(self)
-        self.cursor_timer.setInterval(3000)  # 3 seconds
-        self.cursor_timer.setSingleShot(True)
-        self.cursor_timer.timeout.connect(self._hide_cursor)
-
-        QApplication.instance().installEventFilter(self)
-        self.cursor_timer.start()
+        self._last_cursor_pos = QCursor.pos()
+        self._last_activity = time.monotonic()
+
+        # Poll the pointer instead of filtering events: no Python call
+        # per input event, and taps/drags still move the cursor position.
+        self.cursor_poll = QTimer(self)
+        self.cursor_poll.setInterval(self.CURSOR_POLL_MS)
+        self.cursor_poll.timeout.connect(self._check_idle)
+        self.cursor_poll.start()
+
+    def _check_idle(self):
+        pos = QCursor.pos()
+        now = time.monotonic()
+
+        if pos != self._last_cursor_pos:
+            self._last_cursor_pos = pos
+            self._last_activity = now
+            self._show_cursor()
+        elif (
+            not self.cursor_hidden
+            and now - self._last_activity >= self.CURSOR_IDLE_S
+        ):
+            self._hide_cursor()
 
     def _hide_cursor(self):
         if self.isActiveWindow() and not self.cursor_hidden:
@@ -202,44 +352,50 @@ class MainWindow(QWidget):
             QApplication.restoreOverrideCursor()
             self.cursor_hidden = False
 
-    def eventFilter(self, obj, event):
-        if self.KIOSK_MODE and self.isActiveWindow():
-            if event.type() in (
-                QEvent.MouseMove,
-                QEvent.MouseButtonPress,
-                QEvent.KeyPress,
-                QEvent.Wheel,
-                QEvent.TouchBegin,
-                QEvent.TouchUpdate,
-            ):
-                self._show_cursor()
-                self.cursor_timer.start()
-
-        return super().eventFilter(obj, event)
-
-
     # ============================================================
     # SETTINGS / SHUTDOWN
     # ============================================================
+    def _ask_password(self) -> bool:
+        if self._password_modal is None:
+            self._password_modal = PasswordModal(self)
+        self._password_modal.reset()
+        return self._password_modal.exec() == QDialog.Accepted
+
     def open_settings(self):
-        if PasswordModal(self).exec() != QDialog.Accepted:
+        if not self._ask_password():
             return
-        dlg = SettingsWindow(self)
-        dlg.settings_applied.connect(self.refresh_active_model)
-        dlg.exec()
+        if self._settings_dialog is None:
+            from gui.windows.settings_window import SettingsWindow
+            self._settings_dialog = SettingsWindow(self)
+            self._settings_dialog.settings_applied.connect(
+                self._on_settings_applied, Qt.UniqueConnection
+            )
+        else:
+            self._settings_dialog.reload()
+        self._settings_dialog.exec()
 
     def request_shutdown(self):
-        if PasswordModal(self).exec() != QDialog.Accepted:
+        if not self._ask_password():
             return
-        if ShutdownConfirmDialog(self).exec() == QDialog.Accepted:
+        if self._shutdown_dialog is None:
+            self._shutdown_dialog = ShutdownConfirmDialog(self)
+        if self._shutdown_dialog.exec() == QDialog.Accepted:
             self.close()
 
     def open_pending_qr_window(self):
+        from gui.windows.qr_print_dialog import QRPrintDialog
         QRPrintDialog(self).exec()
 
     # ============================================================
     # MODEL / CYCLES
     # ============================================================
+    @Slot()
+    def _on_settings_applied(self):
+        # Models may have been edited in the dialog; re-read once
+        invalidate_active_model_cache()
+        self.model_debounce.start()
+
+    @Slot()
     def refresh_active_model(self):
         model = get_active_model()
         if not model:
@@ -264,26 +420,56 @@ class MainWindow(QWidget):
 
         self.plot_panel.update_cycle_result(cycle)
         self.result_panel.update_result(cycle)
-        QTimer.singleShot(80, self.refresh_cycles)
+        self.cycles_debounce.start()
 
     def refresh_cycles(self):
-        try:
-            cycles = get_cycles(limit=40)
-        except Exception:
-            cycles = []
-        self.cycles_panel.update_cycles(cycles)
+        if self._cycles_inflight:
+            # Fetch again once the running one lands
+            self._cycles_stale = True
+            return
+
+        self._cycles_inflight = True
+        QThreadPool.globalInstance().start(
+            _CyclesFetchWorker(
+                self._cycles_fetch, self.CYCLES_LIMIT, self._last_cycle_id
+            )
+        )
+
+    @Slot(list)
+    def _on_cycles_ready(self, cycles: list):
+        self._cycles_inflight = False
+
+        if cycles:
+            # Only rows newer than _last_cycle_id come back after boot
+            merged = cycles + self._recent_cycles
+            self._recent_cycles = merged[:self.CYCLES_LIMIT]
+            self._last_cycle_id = max(
+                self._last_cycle_id,
+                max(int(c.get("id") or 0) for c in cycles)
+            )
+
+        self.cycles_panel.update_cycles(self._recent_cycles)
+
+        if self._cycles_stale:
+            self._cycles_stale = False
+            self.refresh_cycles()
 
     # ============================================================
     # LASER STATUS
     # ============================================================
     @Slot(str)
     def on_laser_status(self, status: str):
+        # Repeated heartbeats of the same state change nothing on screen
+        if status == self._last_laser_status:
+            return
+        self._last_laser_status = status
+
         if status != "CONNECTED":
             self.plot_panel.show_no_data()
             self.result_panel.show_error("NO DATA")
 
     def open_history_window(self):
-        if PasswordModal(self).exec() != QDialog.Accepted:
+        if not self._ask_password():
             return
 
         from gui.windows.history_window import HistoryWindow
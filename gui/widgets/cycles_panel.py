@@ -1,11 +1,53 @@
 # gui/widgets/cycles_panel.py
 
+import heapq
 from datetime import datetime
+from functools import lru_cache
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QHBoxLayout, QLabel
 from PySide6.QtGui import QFont
 from PySide6.QtCore import Qt
 
 
+@lru_cache(maxsize=256)
+def _parse_ts(text: str) -> datetime:
+    return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
+def _as_datetime(ts) -> datetime:
+    """
+    MySQL DATETIME columns already arrive as datetime; only strings are
+    parsed, and each distinct string only once.
+    """
+    if isinstance(ts, datetime):
+        return ts
+    return _parse_ts(str(ts))
+
+
+def _qr_value(cycle: dict):
+    """
+    QR shown for a cycle; rows from different sources name it differently.
+    """
+    return cycle.get("qr_text") or cycle.get("qr_code") or cycle.get("qr")
+
+
+def _card_qss(result: str, accent: str, qr_color: str, qr_style: str) -> str:
+    return f"""
+            QFrame#cycleCard[result="{result}"] {{
+                background-color: #111827;     /* Use background-color, not just background */
+                border-radius: 10px;
+                border-left: 6px solid {accent};
+                border: 1px solid #1f2937;
+            }}
+            QFrame#cycleCard[result="{result}"] QLabel#cardModel {{
+                color: {accent};
+            }}
+            QFrame#cycleCard[result="{result}"] QLabel#cardQr {{
+                color: {qr_color};
+                font-style: {qr_style};
+            }}
+        """
+
+
 class CyclesPanel(QFrame):
     """
     Latest Cycles Panel – Production Final (Mode Aware)
@@ -22,6 +64,31 @@ class CyclesPanel(QFrame):
     PANEL_PADDING_V = 14
     PANEL_PADDING_H = 16
 
+    # Panel + card rules in one sheet, set once on the panel; cards only
+    # carry an object name and a "result" property
+    _PANEL_QSS = """
+            QFrame {
+                background: #0a0f1a;
+                border-radius: 14px;
+                border: 1px solid #1a2a3a;
+            }
+            /* Remove any inherited or default widget backgrounds inside */
+            QFrame#cycleCard QLabel {
+                background: transparent;
+                border: none;
+                padding: 0;
+                margin: 0;
+            }
+            QFrame#cycleCard QLabel#cardTime {
+                color: #9ca3af;
+            }
+        """ + _card_qss("pass", "#00f5a0", "#00f5a0", "normal") \
+        + _card_qss("fail", "#ff4d4f", "#f87171", "italic")
+
+    # Card fonts, shared by every card (built on first use, once a
+    # QGuiApplication exists)
+    _fonts = None
+
     # --------------------------------------------------
     # Init
     # --------------------------------------------------
@@ -29,6 +96,13 @@ class CyclesPanel(QFrame):
         super().__init__(parent)
 
         self.kiosk_mode = kiosk_mode
+
+        # Card reuse across refreshes (see update_cycles)
+        self._cards = {}          # card key -> card widget
+        self._shown_keys = None   # keys rendered last time, in order
+        self._spacers = []
+        self._empty_lbl = None
+
         self._apply_mode()
         self._build_ui()
 
@@ -61,13 +135,7 @@ class CyclesPanel(QFrame):
     # UI
     # --------------------------------------------------
     def _build_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background: #0a0f1a;
-                border-radius: 14px;
-                border: 1px solid #1a2a3a;
-            }
-        """)
+        self.setStyleSheet(self._PANEL_QSS)
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(
@@ -95,75 +163,119 @@ class CyclesPanel(QFrame):
     # --------------------------------------------------
     # Update cycles
     # --------------------------------------------------
-    def update_cycles(self, cycles: list):
+    @staticmethod
+    def _card_key(cycle: dict) -> tuple:
+        """
+        Identity of a rendered card; unchanged key = reuse the widget.
+        """
+        return (
+            cycle.get("id"),
+            cycle.get("timestamp"),
+            cycle.get("pass_fail"),
+            cycle.get("peak_height"),
+            _qr_value(cycle),
+        )
+
+    def _take_all(self):
         while self.card_container.count():
-            item = self.card_container.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+            self.card_container.takeAt(0)
 
-        if not cycles:
-            empty = QLabel("No cycles recorded")
-            empty.setAlignment(Qt.AlignCenter)
+    def _show_empty(self):
+        if self._empty_lbl is None:
+            self._empty_lbl = QLabel("No cycles recorded")
+            self._empty_lbl.setAlignment(Qt.AlignCenter)
             font = QFont("Segoe UI", 13)
             font.setItalic(True)
-            empty.setFont(font)
-            empty.setStyleSheet("color:#6b7280;")
-            empty.setFixedHeight(
+            self._empty_lbl.setFont(font)
+            self._empty_lbl.setStyleSheet("color:#6b7280;")
+            self._empty_lbl.setFixedHeight(
                 self.MAX_CYCLES * self.CARD_HEIGHT
                 + (self.MAX_CYCLES - 1) * self.CARD_SPACING
             )
-            self.card_container.addWidget(empty)
-            return
+        self.card_container.addWidget(self._empty_lbl)
+        self._empty_lbl.show()
 
-        cycles = sorted(
-            cycles,
-            key=lambda c: datetime.fromisoformat(
-                str(c.get("timestamp", "1900-01-01")).replace("Z", "+00:00")
-            ),
-            reverse=True,
+    def update_cycles(self, cycles: list):
+        # Only the newest MAX_CYCLES are shown; no need to sort the rest
+        recent = heapq.nlargest(
+            self.MAX_CYCLES,
+            cycles or (),
+            key=lambda c: _as_datetime(c.get("timestamp") or "1900-01-01"),
         )
+        keys = [self._card_key(c) for c in recent]
 
-        recent = cycles[:self.MAX_CYCLES]
+        # Nothing new since last refresh: leave the widgets alone
+        if self._shown_keys is not None and keys == self._shown_keys:
+            return
+        self._shown_keys = keys
 
-        for cycle in recent:
-            self.card_container.addWidget(self._create_card(cycle))
+        # One layout pass and repaint for the whole swap, not one per card
+        self.setUpdatesEnabled(False)
+        try:
+            self._render(keys, recent)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _render(self, keys: list, recent: list):
+        self._take_all()
+
+        # Drop cards that scrolled out; keep the rest for reuse
+        wanted = set(keys)
+        for key in list(self._cards):
+            if key not in wanted:
+                self._cards.pop(key).deleteLater()
+
+        if self._empty_lbl is not None:
+            self._empty_lbl.hide()
+
+        if not recent:
+            for spacer in self._spacers:
+                spacer.hide()
+            self._show_empty()
+            return
+
+        for key, cycle in zip(keys, recent):
+            card = self._cards.get(key)
+            if card is None:
+                card = self._cards[key] = self._create_card(cycle)
+            self.card_container.addWidget(card)
 
         # Fill remaining slots to keep height stable
-        for _ in range(self.MAX_CYCLES - len(recent)):
+        free = self.MAX_CYCLES - len(recent)
+        while len(self._spacers) < free:
             spacer = QFrame()
             spacer.setFixedHeight(self.CARD_HEIGHT)
-            self.card_container.addWidget(spacer)
+            self._spacers.append(spacer)
+        for i, spacer in enumerate(self._spacers):
+            if i < free:
+                self.card_container.addWidget(spacer)
+                spacer.show()
+            else:
+                spacer.hide()
 
     # --------------------------------------------------
     # Card
     # --------------------------------------------------
+    @classmethod
+    def _card_fonts(cls) -> dict:
+        if cls._fonts is None:
+            cls._fonts = {
+                "model": QFont("Segoe UI", 14, QFont.Bold),
+                "time": QFont("Segoe UI", 12),
+                "qr_pass": QFont("Consolas", 28, QFont.Bold),
+                "qr_fail": QFont("Consolas", 16, QFont.Normal),
+            }
+        return cls._fonts
+
     def _create_card(self, cycle: dict) -> QFrame:
         status = (cycle.get("pass_fail") or "").upper()
         is_pass = status == "PASS"
-
-        accent = "#00f5a0" if is_pass else "#ff4d4f"
-        fg_main = "#e5e7eb"
-        fg_muted = "#9ca3af"
+        fonts = self._card_fonts()
 
         card = QFrame()
+        card.setObjectName("cycleCard")
+        card.setProperty("result", "pass" if is_pass else "fail")
         card.setFixedHeight(self.CARD_HEIGHT)
-        
-        # CRITICAL FIX: Ensure card background is solid and consistent
-        card.setStyleSheet(f"""
-            QFrame {{
-                background-color: #111827;     /* Use background-color, not just background */
-                border-radius: 10px;
-                border-left: 6px solid {accent};
-                border: 1px solid #1f2937;
-            }}
-            /* Remove any inherited or default widget backgrounds inside */
-            QLabel {{
-                background: transparent;
-                border: none;
-                padding: 0;
-                margin: 0;
-            }}
-        """)
 
         layout = QHBoxLayout(card)
         layout.setContentsMargins(14, 10, 14, 10)
@@ -180,42 +292,27 @@ class CyclesPanel(QFrame):
         model_with_depth = f"{model_name} {depth_str}"
 
         model_lbl = QLabel(model_with_depth)
-        model_lbl.setFont(QFont("Segoe UI", 14, QFont.Bold))
-        model_lbl.setStyleSheet(f"color: {accent}; background: transparent;")
+        model_lbl.setObjectName("cardModel")
+        model_lbl.setFont(fonts["model"])
         left.addWidget(model_lbl)
 
         time_lbl = QLabel(self._format_timestamp(cycle.get("timestamp")))
-        time_lbl.setFont(QFont("Segoe UI", 12))
-        time_lbl.setStyleSheet(f"color: {fg_muted}; background: transparent;")
+        time_lbl.setObjectName("cardTime")
+        time_lbl.setFont(fonts["time"])
         left.addWidget(time_lbl)
 
         layout.addLayout(left, stretch=1)
 
         # ----- RIGHT -----
         right_label = QLabel()
+        right_label.setObjectName("cardQr")
         right_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        right_label.setFont(QFont("Consolas", 28 if is_pass else 16, QFont.Bold if is_pass else QFont.Normal))
-        
+        right_label.setFont(fonts["qr_pass"] if is_pass else fonts["qr_fail"])
+
         if is_pass:
-            qr_value = (
-                cycle.get("qr_text")
-                or cycle.get("qr_code")
-                or cycle.get("qr")
-                or "—"
-            )
-            right_label.setText(qr_value)
-            right_label.setStyleSheet("""
-                color: #00f5a0;
-                background: transparent;
-                font-style: normal;
-            """)
+            right_label.setText(_qr_value(cycle) or "—")
         else:
             right_label.setText("No QR generated")
-            right_label.setStyleSheet("""
-                color: #f87171;
-                background: transparent;
-                font-style: italic;
-            """)
 
         layout.addWidget(right_label, stretch=2)
 
@@ -226,10 +323,6 @@ class CyclesPanel(QFrame):
         if not ts:
             return "—"
         try:
-            if isinstance(ts, datetime):
-                dt = ts
-            else:
-                dt = datetime.fromisoformat(str(ts).replace("Z", "+00:00"))
-            return dt.strftime("%d %b %Y  %H:%M:%S")
+            return _as_datetime(ts).strftime("%d %b %Y  %H:%M:%S")
         except Exception:
             return "Invalid time"
@@ -4,9 +4,9 @@ from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QWidget, QScrollArea
 )
 from PySide6.QtGui import QFont
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Slot
 
-from backend.usb_printer_manager import printer_signals, usb_printer
+from backend.usb_printer_manager import printer_signals, get_usb_printer
 from backend.gsm_modem import modem_signals, gsm
 from backend.plc_status import plc_listener
 
@@ -36,6 +36,30 @@ class FooterWidget(QFrame):
     START_PAUSE_MS = 2000
     END_PAUSE_MS = 2000
 
+    _QSS = """
+        #FooterWidget {
+            background: qlineargradient(
+                x1:0, y1:0, x2:0, y2:1,
+                stop:0 #0f1622,
+                stop:0.5 #0d1420,
+                stop:1 #0a101a
+            );
+        }
+
+        #FooterWidget QLabel,
+        #FooterWidget QWidget,
+        #FooterWidget QScrollArea,
+        #FooterWidget QScrollArea QWidget {
+            background: transparent;
+            border: none;
+        }
+
+        /* Status colours follow the label's "status" property */
+        #FooterWidget QLabel[status="unknown"] { color:#cbd5f5; }
+        #FooterWidget QLabel[status="ok"] { color:#22c55e; }
+        #FooterWidget QLabel[status="fail"] { color:#ef4444; }
+        """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("FooterWidget")
@@ -64,7 +88,7 @@ class FooterWidget(QFrame):
         self._connect_signals()
 
         # Request initial states
-        usb_printer.emit_current_status()
+        get_usb_printer().emit_current_status()
         gsm.emit_current_status()
         plc_listener.emit_current_status()
 
@@ -73,24 +97,7 @@ class FooterWidget(QFrame):
     # --------------------------------------------------
     def _build_ui(self):
         # IMPORTANT: Scoped stylesheet (matches HeaderWidget logic)
-        self.setStyleSheet("""
-        #FooterWidget {
-            background: qlineargradient(
-                x1:0, y1:0, x2:0, y2:1,
-                stop:0 #0f1622,
-                stop:0.5 #0d1420,
-                stop:1 #0a101a
-            );
-        }
-
-        #FooterWidget QLabel,
-        #FooterWidget QWidget,
-        #FooterWidget QScrollArea,
-        #FooterWidget QScrollArea QWidget {
-            background: transparent;
-            border: none;
-        }
-        """)
+        self.setStyleSheet(self._QSS)
 
         root = QHBoxLayout(self)
         root.setContentsMargins(20, 6, 20, 6)
@@ -134,7 +141,7 @@ class FooterWidget(QFrame):
     def _create_status_label(self, name: str) -> QLabel:
         lbl = QLabel(f"{name}: ---")
         lbl.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        lbl.setStyleSheet("color:#cbd5f5;")
+        lbl.setProperty("status", "unknown")
         lbl.setAlignment(Qt.AlignVCenter | Qt.AlignLeft)
         return lbl
 
@@ -142,32 +149,48 @@ class FooterWidget(QFrame):
     # Signals
     # --------------------------------------------------
     def _connect_signals(self):
-        modem_signals.modem_connected.connect(self.update_modem)
-        plc_listener.plc_status_changed.connect(self.update_plc)
-        printer_signals.printer_status.connect(self.update_printer)
+        # Module-level singletons: never stack a second connection
+        modem_signals.modem_connected.connect(
+            self.update_modem, Qt.UniqueConnection
+        )
+        plc_listener.plc_status_changed.connect(
+            self.update_plc, Qt.UniqueConnection
+        )
+        printer_signals.printer_status.connect(
+            self.update_printer, Qt.QueuedConnection | Qt.UniqueConnection
+        )
 
     # --------------------------------------------------
     # Status updates
     # --------------------------------------------------
+    @Slot(bool)
     def update_modem(self, connected: bool):
         self._set_status(self.modem_lbl, "Modem", connected)
 
+    @Slot(dict)
     def update_plc(self, status: dict):
         self._set_status(self.plc_lbl, "PLC", status.get("power", False))
 
+    @Slot(bool, str)
     def update_printer(self, connected: bool, name: str):
         extra = f" ({name})" if connected and name else ""
         self._set_status(self.printer_lbl, "Printer", connected, extra)
 
     def _set_status(self, label: QLabel, name: str, ok: bool, extra: str = ""):
-        color = "#22c55e" if ok else "#ef4444"
         state = "CONNECTED" if ok else "DISCONNECTED"
         label.setText(f"{name}: {state}{extra}")
-        label.setStyleSheet(f"color:{color};")
+
+        # Re-polish only on an actual flip; no stylesheet is re-parsed
+        status = "ok" if ok else "fail"
+        if label.property("status") != status:
+            label.setProperty("status", status)
+            label.style().unpolish(label)
+            label.style().polish(label)
 
     # --------------------------------------------------
     # SMS handling
     # --------------------------------------------------
+    @Slot(dict)
     def show_sms(self, info: dict):
         name = info.get("name", "Unknown")
         phone = info.get("phone", "-")
@@ -24,6 +24,24 @@ class HeaderWidget(QFrame):
     LOGO_HEIGHT = 36
     ICON_BTN_SIZE = (38, 34)
 
+    _QSS = """
+            #HeaderWidget {
+                background: qlineargradient(
+                    x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #0f1622,
+                    stop:0.5 #0d1420,
+                    stop:1 #0a101a
+                );
+                border-bottom: 1px solid #1a3a5a;
+            }
+        """
+
+    LOGO_PATH = os.path.join("assets", "logo.png")
+
+    # Scaled logo, loaded once per process (built on first use, once a
+    # QGuiApplication exists)
+    _logo = None
+
     def __init__(
         self,
         on_print_clicked,
@@ -40,26 +58,31 @@ class HeaderWidget(QFrame):
         self.on_history_clicked = on_history_clicked   # ✅ FIX
         self.on_shutdown_clicked = on_shutdown_clicked
         self.kiosk_mode = kiosk_mode
+        self._last_datetime = ""
 
         self.setFixedHeight(self.HEADER_HEIGHT)
         self._build_ui()
 
+    # --------------------------------------------------
+    @classmethod
+    def _logo_pixmap(cls) -> QPixmap:
+        # A missing file just yields a null pixmap; no separate stat
+        if cls._logo is None:
+            pixmap = QPixmap(cls.LOGO_PATH)
+            if not pixmap.isNull():
+                pixmap = pixmap.scaledToHeight(
+                    cls.LOGO_HEIGHT,
+                    Qt.SmoothTransformation
+                )
+            cls._logo = pixmap
+        return cls._logo
+
     # --------------------------------------------------
     def _build_ui(self):
         self.setObjectName("HeaderWidget")
 
         # ---------------- Header Style ----------------
-        self.setStyleSheet("""
-            #HeaderWidget {
-                background: qlineargradient(
-                    x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #0f1622,
-                    stop:0.5 #0d1420,
-                    stop:1 #0a101a
-                );
-                border-bottom: 1px solid #1a3a5a;
-            }
-        """)
+        self.setStyleSheet(self._QSS)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 6, 20, 6)
@@ -70,16 +93,9 @@ class HeaderWidget(QFrame):
         logo.setFixedHeight(self.LOGO_HEIGHT)
         logo.setStyleSheet("background: transparent;")
 
-        logo_path = os.path.join("assets", "logo.png")
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            if not pixmap.isNull():
-                logo.setPixmap(
-                    pixmap.scaledToHeight(
-                        self.LOGO_HEIGHT,
-                        Qt.SmoothTransformation
-                    )
-                )
+        pixmap = self._logo_pixmap()
+        if not pixmap.isNull():
+            logo.setPixmap(pixmap)
 
         # ---------------- Company Name ----------------
         company = QLabel("ASHTECH ENGINEERING SOLUTIONS")
@@ -176,5 +192,8 @@ class HeaderWidget(QFrame):
 
     # --------------------------------------------------
     def set_datetime(self, text: str):
-        """Update live date/time label"""
+        """Update live date/time label (no-op if the text is unchanged)"""
+        if text == self._last_datetime:
+            return
+        self._last_datetime = text
         self.datetime_lbl.setText(text)
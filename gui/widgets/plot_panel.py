@@ -2,19 +2,16 @@
 
 import time
 import logging
-from typing import List, Tuple
-
-try:
-    import numpy as np
-    HAS_NUMPY = True
-except ImportError:
-    HAS_NUMPY = False
+from collections import deque
 
+import numpy as np
 import pyqtgraph as pg
 from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel, QGraphicsPixmapItem
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QFont, QPixmap
 
+from config.app_config import ENABLE_PLOT_OPENGL
+
 log = logging.getLogger(__name__)
 
 
@@ -34,14 +31,43 @@ class PlotPanel(QFrame):
     UPDATE_INTERVAL_MS = 100
     MAX_CYCLE_OVERLAYS = 6
 
+    _PANEL_QSS = """
+            QFrame {
+                background:#0b111b;
+                border:1px solid #30363d;
+                border-radius:8px;
+            }
+        """
+
+    _BADGE_QSS = """
+            QLabel {
+                background:#0f1622;
+                border:1px solid #2d3b4f;
+                border-radius:8px;
+                padding:10px;
+                color:#e6edf3;
+            }
+        """
+
     # --------------------------------------------------
     def __init__(self, parent=None):
         super().__init__(parent)
 
         # ---------------- Live Data ----------------
-        self.data: List[Tuple[float, float]] = []
+        # Ring buffer written twice (i and i + MAX_POINTS) so the last
+        # MAX_POINTS samples are always one contiguous slice — no copy.
+        self._t_buf = np.empty(2 * self.MAX_POINTS, dtype=np.float64)
+        self._v_buf = np.empty(2 * self.MAX_POINTS, dtype=np.float64)
+        self._head = 0
+        self._count = 0
         self.latest_value: float | None = None
 
+        # Sliding-window min/max: monotonic deques of (seq, value), so the
+        # Y range is read off the fronts instead of scanning the window.
+        self._seq = 0
+        self._min_q: deque = deque()
+        self._max_q: deque = deque()
+
         # ---------------- Model Info ----------------
         self.model_name = ""
         self.model_type = ""
@@ -49,6 +75,9 @@ class PlotPanel(QFrame):
         self.upper_limit = 0.0
         self.touch_point: float | None = None
 
+        self._badge_text = ""  # last text pushed to the badge
+        self._y_range = None    # last Y range pushed to the view
+
         # ---------------- Touch Point Line ----------------
         self._touch_line: pg.InfiniteLine | None = None
 
@@ -56,6 +85,7 @@ class PlotPanel(QFrame):
         self._cycle_overlays = []
 
         # ---------------- Throttle ----------------
+        self._dirty = False  # new samples since the last repaint
         self._pending_update = False
         self._update_timer = QTimer(self)
         self._update_timer.setSingleShot(True)
@@ -67,13 +97,7 @@ class PlotPanel(QFrame):
     # UI
     # ==================================================
     def _build_ui(self):
-        self.setStyleSheet("""
-            QFrame {
-                background:#0b111b;
-                border:1px solid #30363d;
-                border-radius:8px;
-            }
-        """)
+        self.setStyleSheet(self._PANEL_QSS)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(8, 8, 8, 8)
@@ -84,6 +108,14 @@ class PlotPanel(QFrame):
         self.plot.showGrid(x=True, y=True, alpha=0.25)
         self.plot.setMouseEnabled(False, False)
         self.plot.enableAutoRange(False, False)
+        self.plot.setXRange(-self.TIME_WINDOW_SEC, 0)
+
+        # Let pyqtgraph peak-decimate to the plot's pixel width
+        self.plot.setDownsampling(auto=True, mode="peak")
+        self.plot.setClipToView(True)
+
+        if ENABLE_PLOT_OPENGL:
+            self._enable_opengl()
 
         self.plot.getAxis("bottom").setTicks([])
         self.plot.getAxis("bottom").setPen("#0b111b")
@@ -107,15 +139,7 @@ class PlotPanel(QFrame):
         self.badge = QLabel("")
         self.badge.setAlignment(Qt.AlignCenter)
         self.badge.setFont(QFont("Segoe UI", 18, QFont.Bold))
-        self.badge.setStyleSheet("""
-            QLabel {
-                background:#0f1622;
-                border:1px solid #2d3b4f;
-                border-radius:8px;
-                padding:10px;
-                color:#e6edf3;
-            }
-        """)
+        self.badge.setStyleSheet(self._BADGE_QSS)
 
         root.addWidget(self.plot)
         root.addWidget(self.badge)
@@ -134,44 +158,63 @@ class PlotPanel(QFrame):
         self._update_badge()
 
     def append_value(self, value: float):
-        self.latest_value = float(value)
-        self.data.append((time.time(), self.latest_value))
-        self._trim_data()
+        self._push_sample(time.time(), float(value))
+        self._dirty = True
+        self._schedule_update()
+
+    def append_values(self, values):
+        """
+        Append a batch of samples with one repaint request.
+        """
+        if not values:
+            return
+        now = time.time()
+        for value in values:
+            self._push_sample(now, float(value))
+        self._dirty = True
         self._schedule_update()
 
     def reset(self):
-        self.data.clear()
+        self._head = 0
+        self._count = 0
+        self._seq = 0
+        self._min_q.clear()
+        self._max_q.clear()
+        self._dirty = False
         self.latest_value = None
         self.curve.clear()
         self._clear_overlays()
-        self._remove_touch_line()
+        self._hide_touch_line()
         self._update_badge()
 
     def show_no_data(self):
         self.curve.clear()
-        self.badge.setText("NO DATA")
+        self._set_badge_text("NO DATA")
 
     # ==================================================
     # TOUCH POINT LINE
     # ==================================================
     def _install_touch_line(self):
-        self._remove_touch_line()
-
         if self.touch_point is None:
+            self._hide_touch_line()
             return
 
-        self._touch_line = pg.InfiniteLine(
-            pos=self.touch_point,
-            angle=0,
-            pen=pg.mkPen("#f59e0b", width=2, style=Qt.DashLine)
-        )
-        self._touch_line.setZValue(20)
-        self.plot.addItem(self._touch_line)
+        # Created once, then only moved: no item churn on model switches
+        if self._touch_line is None:
+            self._touch_line = pg.InfiniteLine(
+                pos=self.touch_point,
+                angle=0,
+                pen=pg.mkPen("#f59e0b", width=2, style=Qt.DashLine)
+            )
+            self._touch_line.setZValue(20)
+            self.plot.addItem(self._touch_line)
+        else:
+            self._touch_line.setValue(self.touch_point)
+            self._touch_line.show()
 
-    def _remove_touch_line(self):
+    def _hide_touch_line(self):
         if self._touch_line:
-            self.plot.removeItem(self._touch_line)
-            self._touch_line = None
+            self._touch_line.hide()
 
     # ==================================================
     # CYCLE ANNOTATION (CALLED BY MainWindow)
@@ -218,29 +261,46 @@ class PlotPanel(QFrame):
     # ==================================================
     # INTERNALS
     # ==================================================
+    def _window(self):
+        """
+        Views of the samples inside TIME_WINDOW_SEC, oldest first.
+        """
+        if self._count < self.MAX_POINTS:
+            start, stop = 0, self._count
+        else:
+            start, stop = self._head, self._head + self.MAX_POINTS
+
+        times = self._t_buf[start:stop]
+        values = self._v_buf[start:stop]
+
+        cutoff = time.time() - self.TIME_WINDOW_SEC
+        first = int(np.searchsorted(times, cutoff))
+        return times[first:], values[first:]
+
     def _update_plot(self):
-        if not self.data:
+        times, values = self._window()
+        if not len(times):
             return
 
-        times, values = zip(*self.data)
         t0 = times[-1]
-        x = [t - t0 for t in times]
-
-        if HAS_NUMPY:
-            x = np.asarray(x)
-            values = np.asarray(values)
 
-        self.curve.setData(x, values)
-        self.plot.setXRange(-self.TIME_WINDOW_SEC, 0)
+        # pyqtgraph keeps the arrays it is given and may repaint from them
+        # on its own (resize, view change); hand it arrays the ring buffer
+        # will not overwrite
+        self.curve.setData(times - t0, values.copy())
 
-        ymin, ymax = min(values), max(values)
+        self._expire_extrema(self._seq - len(values))
+        ymin, ymax = self._min_q[0][1], self._max_q[0][1]
         pad = max((ymax - ymin) * 0.3, 1.0)
 
         if self.touch_point is not None:
             ymin = min(ymin, self.touch_point)
             ymax = max(ymax, self.touch_point)
 
-        self.plot.setYRange(ymin - pad, ymax + pad)
+        y_range = (ymin - pad, ymax + pad)
+        if y_range != self._y_range:
+            self._y_range = y_range
+            self.plot.setYRange(*y_range)
 
         for c in self._cycle_overlays:
             dx = c["ts"] - t0
@@ -249,9 +309,14 @@ class PlotPanel(QFrame):
 
         self._update_badge()
 
+    def _set_badge_text(self, text: str):
+        if text != self._badge_text:
+            self._badge_text = text
+            self.badge.setText(text)
+
     def _update_badge(self):
         if not self.model_name:
-            self.badge.setText("")
+            self._set_badge_text("")
             return
 
         live = (
@@ -259,7 +324,7 @@ class PlotPanel(QFrame):
             if self.latest_value is not None else "—"
         )
 
-        self.badge.setText(
+        self._set_badge_text(
             f"{self.model_name} | {self.model_type} | "
             f"Limits: {self.lower_limit:.1f} – {self.upper_limit:.1f} mm | "
             f"Touch: {self.touch_point:.2f} mm | "
@@ -274,11 +339,40 @@ class PlotPanel(QFrame):
     def reset_cycle_markers(self):
         self._clear_overlays()
 
-    def _trim_data(self):
-        cutoff = time.time() - self.TIME_WINDOW_SEC
-        self.data = [d for d in self.data if d[0] >= cutoff]
-        if len(self.data) > self.MAX_POINTS:
-            self.data = self.data[-self.MAX_POINTS:]
+    def _push_sample(self, t: float, value: float):
+        self.latest_value = value
+
+        i = self._head
+        j = i + self.MAX_POINTS
+        self._t_buf[i] = self._t_buf[j] = t
+        self._v_buf[i] = self._v_buf[j] = value
+
+        self._head = (i + 1) % self.MAX_POINTS
+        if self._count < self.MAX_POINTS:
+            self._count += 1
+
+        self._push_extrema(value)
+
+    def _push_extrema(self, value: float):
+        seq = self._seq
+        self._seq += 1
+
+        while self._min_q and self._min_q[-1][1] >= value:
+            self._min_q.pop()
+        self._min_q.append((seq, value))
+
+        while self._max_q and self._max_q[-1][1] <= value:
+            self._max_q.pop()
+        self._max_q.append((seq, value))
+
+        # Samples overwritten in the ring can never be in the window again
+        self._expire_extrema(self._seq - self.MAX_POINTS)
+
+    def _expire_extrema(self, first_seq: int):
+        while self._min_q[0][0] < first_seq:
+            self._min_q.popleft()
+        while self._max_q[0][0] < first_seq:
+            self._max_q.popleft()
 
     def _schedule_update(self):
         if not self._pending_update:
@@ -287,8 +381,26 @@ class PlotPanel(QFrame):
 
     def _apply_update(self):
         self._pending_update = False
+        if not self._dirty:
+            return
+        self._dirty = False
         self._update_plot()
 
+    # ==================================================
+    # OPENGL
+    # ==================================================
+    def _enable_opengl(self):
+        """
+        Render the plot through a GL viewport; stay on QPainter if the
+        machine has no usable GL context.
+        """
+        try:
+            self.plot.useOpenGL(True)
+            log.info("Plot rendering via OpenGL")
+        except Exception:
+            log.warning("OpenGL unavailable, using software plot rendering",
+                        exc_info=True)
+
     # ==================================================
     # WATERMARK
     # ==================================================
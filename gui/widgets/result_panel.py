@@ -6,24 +6,45 @@ from PySide6.QtGui import QFont, QFontMetrics
 from PySide6.QtCore import Qt, QTimer
 
 
+def _qr_box_qss(border_color: str, color: str) -> str:
+    return f"""
+            background: #111;
+            border: 2px solid {border_color};
+            border-radius: 12px;
+            color: {color};
+            padding: 40px;
+        """
+
+
 class ResultPanel(QFrame):
     """
     Enhanced Result Panel with adaptive font sizing and smart wrapping
     for variable-length model names and QR texts (including underscore-separated).
     """
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._build_ui()
+    # Stylesheets per result, built once at class creation
+    _STATUS_QSS_PASS = "color: #00ffaa;"
+    _STATUS_QSS_FAIL = "color: #ff4444;"
+    _STATUS_QSS_IDLE = "color: #888;"
 
-    def _build_ui(self):
-        self.setStyleSheet("""
+    _QR_QSS_PASS = _qr_box_qss("#00ffaa", "#00ffaa")
+    _QR_QSS_FAIL = _qr_box_qss("#ff4444", "#666")
+    _QR_QSS_IDLE = _qr_box_qss("#333", "#666")
+
+    _PANEL_QSS = """
             ResultPanel {
                 background: #0a0a0a;
                 border-radius: 14px;
                 border: 1px solid #222;
             }
-        """)
+        """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._build_ui()
+
+    def _build_ui(self):
+        self.setStyleSheet(self._PANEL_QSS)
 
         root = QHBoxLayout(self)
         root.setContentsMargins(32, 32, 32, 32)
@@ -37,7 +58,7 @@ class ResultPanel(QFrame):
         self.status_lbl = QLabel("Waiting for cycle...")
         self.status_lbl.setFont(QFont("Segoe UI", 48, QFont.Bold))
         self.status_lbl.setAlignment(Qt.AlignCenter)
-        self.status_lbl.setStyleSheet("color: #888;")
+        self.status_lbl.setStyleSheet(self._STATUS_QSS_IDLE)
 
         self.details_lbl = QLabel("")
         self.details_lbl.setFont(QFont("Segoe UI", 24))
@@ -55,13 +76,7 @@ class ResultPanel(QFrame):
         self.qr_lbl.setFont(QFont("Consolas", 55, QFont.Bold))
         self.qr_lbl.setWordWrap(True)
         self.qr_lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        self.qr_lbl.setStyleSheet("""
-            background: #111;
-            border: 2px solid #333;
-            border-radius: 12px;
-            color: #666;
-            padding: 40px;
-        """)
+        self.qr_lbl.setStyleSheet(self._QR_QSS_IDLE)
 
         root.addLayout(left_layout, stretch=4)
         root.addWidget(self.qr_lbl, stretch=6)
@@ -119,34 +134,17 @@ class ResultPanel(QFrame):
         # === Status and styling ===
         if status == "PASS":
             self.status_lbl.setText("PASS")
-            self.status_lbl.setStyleSheet("""
-                color: #00ffaa;
-            """)
-            border_color = "#00ffaa"
-            glow = "0 0 30px #00ffaa44"
-            qr_color = "#00ffaa"
+            self.status_lbl.setStyleSheet(self._STATUS_QSS_PASS)
+            self.qr_lbl.setStyleSheet(self._QR_QSS_PASS)
         elif status == "FAIL":
             self.status_lbl.setText("FAIL")
-            self.status_lbl.setStyleSheet("color: #ff4444;")
-            border_color = "#ff4444"
-            glow = "0 0 24px #ff444455"
-            qr_color = "#666"
+            self.status_lbl.setStyleSheet(self._STATUS_QSS_FAIL)
+            self.qr_lbl.setStyleSheet(self._QR_QSS_FAIL)
             qr_text = "—"
         else:
             self.status_lbl.setText("Waiting for cycle...")
-            self.status_lbl.setStyleSheet("color: #888;")
-            border_color = "#333"
-            glow = "none"
-            qr_color = "#666"
-
-        # Apply style to QR box
-        self.qr_lbl.setStyleSheet(f"""
-            background: #111;
-            border: 2px solid {border_color};
-            border-radius: 12px;
-            color: {qr_color};
-            padding: 40px;
-        """)
+            self.status_lbl.setStyleSheet(self._STATUS_QSS_IDLE)
+            self.qr_lbl.setStyleSheet(self._QR_QSS_IDLE)
 
         # === Details text ===
         details_text = (
@@ -160,24 +158,17 @@ class ResultPanel(QFrame):
         display_qr_text = self._allow_wrap_at_underscores(qr_text)
         self.qr_lbl.setText(display_qr_text)
 
-        # === Adaptive font sizing (after layout update) ===
-        QTimer.singleShot(0, lambda: self._adjust_font_to_fit(
-            self.qr_lbl, display_qr_text, base_size=80, min_size=32))
+        # === Adaptive font sizing (after layout update, one deferred call) ===
+        QTimer.singleShot(0, lambda: self._fit_fonts(display_qr_text, details_text))
 
-        QTimer.singleShot(0, lambda: self._adjust_font_to_fit(
-            self.details_lbl, details_text, base_size=30, min_size=18))
+    def _fit_fonts(self, qr_text: str, details_text: str):
+        self._adjust_font_to_fit(self.qr_lbl, qr_text, base_size=80, min_size=32)
+        self._adjust_font_to_fit(self.details_lbl, details_text, base_size=30, min_size=18)
 
     def show_error(self, text: str):
         self.status_lbl.setText(text)
-        self.status_lbl.setStyleSheet("color: #ff4444;")
-
-        self.qr_lbl.setStyleSheet("""
-            background: #111;
-            border: 2px solid #ff4444;
-            border-radius: 12px;
-            color: #666;
-            padding: 40px;
-        """)
+        self.status_lbl.setStyleSheet(self._STATUS_QSS_FAIL)
+        self.qr_lbl.setStyleSheet(self._QR_QSS_FAIL)
 
         self.details_lbl.setText("")
         self.qr_lbl.setText("—")
\ No newline at end of file
@@ -285,6 +285,18 @@ class AlertPhonesTab(QWidget):
         for model in get_models():
             self.model_combo.addItem(model["name"], model["id"])
 
+    # --------------------------------------------------
+    def refresh(self):
+        """
+        Reload the model list and return to the no-model-selected state
+        """
+        self.model_combo.blockSignals(True)
+        try:
+            self._load_models()
+        finally:
+            self.model_combo.blockSignals(False)
+        self._on_model_changed()
+
     # --------------------------------------------------
     def _on_model_changed(self):
         self.current_model_id = self.model_combo.currentData()
@@ -173,6 +173,13 @@ class ChangePasswordTab(QWidget):
                 "Please check system logs."
             )
 
+    # --------------------------------------------------
+    def reset(self):
+        """
+        Clear any half-typed passwords before the tab is shown again
+        """
+        self._clear_fields()
+
     # --------------------------------------------------
     def _clear_fields(self):
         self.current_pwd.clear()
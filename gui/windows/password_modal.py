@@ -35,6 +35,8 @@ class PasswordModal(QDialog):
         self.setModal(True)
         self.setFixedSize(self.WIDTH, self.HEIGHT)
 
+        self._denied_box = None  # built on first wrong password, then reused
+
         self._build_ui()
 
         # Apply centralized internal styling
@@ -95,6 +97,14 @@ class PasswordModal(QDialog):
         # ---------------- Keyboard shortcuts ----------------
         self.password_input.returnPressed.connect(self._verify_password)
 
+    # -------------------------------------------------
+    # Reuse
+    # -------------------------------------------------
+    def reset(self):
+        """Clear any previous entry so a cached modal can be re-shown."""
+        self.password_input.clear()
+        self.password_input.setFocus()
+
     # -------------------------------------------------
     # Logic
     # -------------------------------------------------
@@ -105,11 +115,15 @@ class PasswordModal(QDialog):
             self.accept()
             return
 
-        QMessageBox.warning(
-            self,
-            "Access Denied",
-            "Incorrect password.\nPlease try again."
-        )
+        if self._denied_box is None:
+            self._denied_box = QMessageBox(
+                QMessageBox.Warning,
+                "Access Denied",
+                "Incorrect password.\nPlease try again.",
+                QMessageBox.Ok,
+                self
+            )
+        self._denied_box.exec()
 
         self.password_input.clear()
         self.password_input.setFocus()
\ No newline at end of file
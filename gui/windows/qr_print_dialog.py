@@ -27,8 +27,9 @@ class QRPrintDialog(QDialog):
         self.setModal(True)
         self.setMinimumSize(self.WIDTH, self.HEIGHT)
 
-        self._build_ui()
+        # Themed before the tabs are built so they inherit it
         apply_base_dialog_style(self)
+        self._build_ui()
 
     def _build_ui(self):
         layout = QVBoxLayout(self)
@@ -54,11 +54,12 @@ class SettingsWindow(QDialog):
         self.setModal(True)
         self.setMinimumSize(self.WIDTH, self.HEIGHT)
 
+        # Themed before the tabs are built so they inherit it
+        apply_base_dialog_style(self)
+
         self._build_ui()
         self._connect_signals()
 
-        apply_base_dialog_style(self)
-
     # ==================================================
     # UI CONSTRUCTION
     # ==================================================
@@ -210,3 +211,15 @@ class SettingsWindow(QDialog):
     def apply_and_close(self):
         self.apply()
         self.accept()
+
+    # ==================================================
+    # REUSE
+    # ==================================================
+    def reload(self):
+        """
+        Re-read tab data so a cached dialog can be shown again
+        """
+        self.models_tab.refresh()
+        self.alert_phones_tab.refresh()
+        self.password_tab.reset()
+        self.tabs.setCurrentIndex(0)
@@ -33,7 +33,7 @@ os.environ["QT_LOGGING_RULES"] = (
 # ------------------------------------------------------
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFontDatabase
-from PySide6.QtCore import QObject, Signal, QTimer, QLoggingCategory
+from PySide6.QtCore import Qt, QObject, Signal, QTimer, QLoggingCategory
 
 # ------------------------------------------------------
 # App config
@@ -111,6 +111,7 @@ from backend.combined_serial_reader import combined_reader, init_combined_reader
 from backend.startup_checks import run_startup_checks
 from backend.sms_sender import start_sms_sender, stop_sms_sender
 from backend.gsm_modem import gsm
+from backend.usb_printer_manager import get_usb_printer
 from backend.settings_dao import get_settings
 from backend.purge_service import run_purge
 
@@ -204,8 +205,14 @@ def main():
 
     combined_reader.laser_value.connect(push_laser_value)
     combined_reader.laser_value.connect(signals.laser_value.emit)
-    combined_reader.plc_status.connect(on_plc_status_update)
-    combined_reader.status_changed.connect(signals.laser_status.emit)
+    # Reader thread -> GUI thread; MainWindow consumes plc_status and
+    # laser_status with direct connections
+    combined_reader.plc_status.connect(
+        on_plc_status_update, Qt.QueuedConnection
+    )
+    combined_reader.status_changed.connect(
+        signals.laser_status.emit, Qt.QueuedConnection
+    )
 
     log.info("Serial reader initialized")
 
@@ -225,6 +232,7 @@ def main():
         combined_reader.stop()
         stop_sms_sender()
         gsm.stop()
+        get_usb_printer().stop()
 
         log.info("Shutdown complete")
 
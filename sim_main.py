@@ -21,7 +21,7 @@ os.environ["QT_LOGGING_RULES"] = "qt.qss.debug=false"
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFontDatabase
-from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtCore import Qt, QObject, Signal, QTimer
 
 # ------------------------------------------------------
 # Application configuration
@@ -191,8 +191,14 @@ def main():
 
     combined_reader.laser_value.connect(push_laser_value)
     combined_reader.laser_value.connect(signals.laser_value.emit)
-    combined_reader.plc_status.connect(on_plc_status_update)
-    combined_reader.status_changed.connect(signals.laser_status.emit)
+    # Reader thread -> GUI thread; MainWindow consumes plc_status and
+    # laser_status with direct connections
+    combined_reader.plc_status.connect(
+        on_plc_status_update, Qt.QueuedConnection
+    )
+    combined_reader.status_changed.connect(
+        signals.laser_status.emit, Qt.QueuedConnection
+    )
 
     log.info("Serial reader initialized")
 